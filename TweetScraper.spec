@@ -24,6 +24,7 @@ a = Analysis(
         'src.config.constants',
         'src.core',
         'src.core.deduplicator',
+        'src.core.bloom_filter',
         'src.core.progress_tracker',
         'src.core.theme_manager',
         'src.core.styles',
@@ -32,8 +33,10 @@ a = Analysis(
         'src.scraper.driver_setup',
         'src.scraper.tweet_parser',
         'src.scraper.tweet_scraper',
+        'src.scraper.tweet_exporter',
         'src.gui',
         'src.gui.signals',
+        'src.gui.tweet_table_model',
         'src.gui.main_window',
     ],
     hookspath=[],
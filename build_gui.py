@@ -4,21 +4,99 @@ GUI Builder untuk Tweet Scraper menggunakan auto-py-to-exe
 Alternatif yang lebih mudah untuk membuat executable
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
+import sysconfig
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Konfigurasi auto-py-to-exe disimpan sebagai string JSON siap tulis,
+# sehingga tidak perlu membangun dict dan encode ulang setiap dijalankan
+_CONFIG_JSON = """{
+  "version": "auto-py-to-exe-configuration_v1",
+  "pyinstaller_options": [
+    {
+      "optionDest": "filenames",
+      "value": "main.py"
+    },
+    {
+      "optionDest": "onefile",
+      "value": true
+    },
+    {
+      "optionDest": "console",
+      "value": false
+    },
+    {
+      "optionDest": "name",
+      "value": "TweetScraper"
+    },
+    {
+      "optionDest": "ascii",
+      "value": false
+    },
+    {
+      "optionDest": "clean_build",
+      "value": true
+    },
+    {
+      "optionDest": "strip",
+      "value": false
+    },
+    {
+      "optionDest": "noupx",
+      "value": false
+    },
+    {
+      "optionDest": "uac_admin",
+      "value": false
+    },
+    {
+      "optionDest": "uac_uiaccess",
+      "value": false
+    },
+    {
+      "optionDest": "win_private_assemblies",
+      "value": false
+    },
+    {
+      "optionDest": "win_no_prefer_redirects",
+      "value": false
+    },
+    {
+      "optionDest": "bootloader_ignore_signals",
+      "value": false
+    },
+    {
+      "optionDest": "disable_windowed_traceback",
+      "value": false
+    },
+    {
+      "optionDest": "hiddenimports",
+      "value": "PyQt5.QtCore,PyQt5.QtGui,PyQt5.QtWidgets,selenium,webdriver_manager,pandas,openpyxl"
+    },
+    {
+      "optionDest": "datas",
+      "value": "requirements.txt;."
+    }
+  ],
+  "nonPyinstallerOptions": {
+    "increaseRecursionLimit": true,
+    "manualArguments": ""
+  }
+}"""
+
 def check_auto_py_to_exe():
     """Check if auto-py-to-exe is installed"""
-    try:
-        import auto_py_to_exe
+    # find_spec hanya mencari lokasi modul tanpa mengeksekusi package-nya
+    if importlib.util.find_spec("auto_py_to_exe") is not None:
         print("✅ auto-py-to-exe sudah terinstall")
         return True
-    except ImportError:
-        print("❌ auto-py-to-exe belum terinstall")
-        return False
+    print("❌ auto-py-to-exe belum terinstall")
+    return False
 
 def install_auto_py_to_exe():
     """Install auto-py-to-exe"""
@@ -33,92 +111,24 @@ def install_auto_py_to_exe():
 
 def create_config_json():
     """Create configuration file for auto-py-to-exe"""
-    config = {
-        "version": "auto-py-to-exe-configuration_v1",
-        "pyinstaller_options": [
-            {
-                "optionDest": "filenames",
-                "value": "main.py"
-            },
-            {
-                "optionDest": "onefile",
-                "value": True
-            },
-            {
-                "optionDest": "console",
-                "value": False
-            },
-            {
-                "optionDest": "name",
-                "value": "TweetScraper"
-            },
-            {
-                "optionDest": "ascii",
-                "value": False
-            },
-            {
-                "optionDest": "clean_build",
-                "value": True
-            },
-            {
-                "optionDest": "strip",
-                "value": False
-            },
-            {
-                "optionDest": "noupx",
-                "value": False
-            },
-            {
-                "optionDest": "uac_admin",
-                "value": False
-            },
-            {
-                "optionDest": "uac_uiaccess",
-                "value": False
-            },
-            {
-                "optionDest": "win_private_assemblies",
-                "value": False
-            },
-            {
-                "optionDest": "win_no_prefer_redirects",
-                "value": False
-            },
-            {
-                "optionDest": "bootloader_ignore_signals",
-                "value": False
-            },
-            {
-                "optionDest": "disable_windowed_traceback",
-                "value": False
-            },
-            {
-                "optionDest": "hiddenimports",
-                "value": "PyQt5.QtCore,PyQt5.QtGui,PyQt5.QtWidgets,selenium,webdriver_manager,pandas,openpyxl"
-            },
-            {
-                "optionDest": "datas",
-                "value": "requirements.txt;."
-            }
-        ],
-        "nonPyinstallerOptions": {
-            "increaseRecursionLimit": True,
-            "manualArguments": ""
-        }
-    }
-    
-    import json
-    with open('auto-py-to-exe-config.json', 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
-    
+    Path('auto-py-to-exe-config.json').write_text(_CONFIG_JSON, encoding='utf-8')
+
     print("✅ File konfigurasi dibuat: auto-py-to-exe-config.json")
 
 def launch_auto_py_to_exe():
     """Launch auto-py-to-exe GUI"""
     print("🚀 Meluncurkan auto-py-to-exe GUI...")
     try:
-        # Launch auto-py-to-exe
-        subprocess.Popen([sys.executable, "-m", "auto_py_to_exe"])
+        # Gunakan console script milik interpreter ini (bukan PATH) agar child
+        # tidak melalui runpy -m; close_fds=False memungkinkan CPython memakai
+        # posix_spawn di POSIX
+        script_name = "auto-py-to-exe.exe" if os.name == 'nt' else "auto-py-to-exe"
+        script_path = os.path.join(sysconfig.get_path("scripts"), script_name)
+        if os.path.isfile(script_path):
+            command = [script_path]
+        else:
+            command = [sys.executable, "-m", "auto_py_to_exe"]
+        subprocess.Popen(command, close_fds=False)
         print("✅ auto-py-to-exe GUI diluncurkan!")
         print("\n📋 Panduan penggunaan:")
         print("1. Pilih 'main.py' sebagai script location")
@@ -274,10 +284,11 @@ def main():
         print("❌ File main.py tidak ditemukan!")
         return
     
-    # Create helper files
-    create_config_json()
-    create_simple_build_script()
-    create_readme()
+    # Create helper files (file terpisah, aman ditulis bersamaan)
+    helpers = (create_config_json, create_simple_build_script, create_readme)
+    with ThreadPoolExecutor(max_workers=len(helpers)) as executor:
+        for future in [executor.submit(helper) for helper in helpers]:
+            future.result()
     
     print("\n📋 Pilihan build method:")
     print("1. auto-py-to-exe (GUI - Recommended)")
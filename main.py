@@ -7,12 +7,14 @@ Version: 2.3.3
 import sys
 from PyQt5.QtWidgets import QApplication
 
-from src.gui.main_window_v2 import TweetScraperGUIV2
-
 
 def run_app():
     """Initialize and run the Tweet Scraper application v2.3.3"""
     app = QApplication(sys.argv)
+
+    # Import GUI setelah QApplication dibuat; import berikutnya memakai sys.modules
+    from src.gui.main_window_v2 import TweetScraperGUIV2
+
     window = TweetScraperGUIV2()
     window.show()
     sys.exit(app.exec_())
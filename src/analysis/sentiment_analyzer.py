@@ -4,7 +4,9 @@ Sentiment Analysis untuk tweet menggunakan Lexicon based approach.
 
 import os
 import re
+from functools import lru_cache
 from typing import Dict, List, Any
+import numpy as np
 import pandas as pd
 
 
@@ -15,10 +17,23 @@ class SentimentAnalyzer:
     Menggunakan modified-lexicon_v2.txt untuk analisis sentimen dengan
     menjumlahkan skor kata-kata yang ditemukan dalam tweet.
 
+    Lexicon baru dibaca saat pertama kali dipakai (analyze_text,
+    analyze_dataframe, atau akses atribut lexicon), sehingga membuat
+    analyzer saat GUI start tidak menambah waktu startup.
+
     Attributes:
         lexicon (Dict[str, int]): Dictionary kata dan skor sentimennya
     """
 
+    _TOKEN_RE = re.compile(r'\w+')
+    """Pattern tokenisasi, dikompilasi sekali dan dipakai di kedua jalur scoring"""
+
+    _LABELS = ('Negatif', 'Netral', 'Positif')
+    """Kategori label, diurutkan agar kode = sign(polarity) + 1"""
+
+    _SCORE_CACHE_SIZE = 65536
+    """Jumlah text (lowercase) yang skornya di-cache oleh analyze_text"""
+
     def __init__(self, lexicon_path: str = None):
         """
         Inisialisasi SentimentAnalyzer.
@@ -27,12 +42,31 @@ class SentimentAnalyzer:
             lexicon_path (str): Path ke file lexicon. Jika None, akan mencari
                           modified-lexicon_v2.txt di root project secara otomatis.
         """
-        self.lexicon = {}
-        self._load_lexicon(lexicon_path)
+        self._lexicon_path = lexicon_path
+        self._lexicon = None
+        self._lexicon_index = pd.Index([], dtype=object)
+        self._lexicon_scores = np.zeros(1, dtype=np.int8)
+
+        # Cache per instance (bukan decorator pada method) agar cache ikut
+        # lexicon instance ini dan tidak menahan referensi self secara global
+        self._score_lowered = lru_cache(maxsize=self._SCORE_CACHE_SIZE)(self._score_lowered_text)
+
+    @property
+    def lexicon(self) -> Dict[str, int]:
+        """Dictionary kata -> skor; dimuat dari file pada akses pertama."""
+        if self._lexicon is None:
+            self._ensure_lexicon()
+        return self._lexicon
+
+    def _ensure_lexicon(self):
+        """Muat lexicon (dan array scoring) jika belum dimuat."""
+        if self._lexicon is None:
+            self._lexicon = {}
+            self._load_lexicon(self._lexicon_path)
 
     def _load_lexicon(self, lexicon_path: str = None):
         """
-        Load lexicon dari file text.
+        Load lexicon dari file text dalam satu panggilan read_csv.
         Format file: kata,skor (per baris)
 
         Args:
@@ -50,26 +84,55 @@ class SentimentAnalyzer:
             return
 
         try:
-            with open(lexicon_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    parts = line.split(',')
-                    if len(parts) >= 2:
-                        word = parts[0].strip().lower()
-                        try:
-                            score = int(parts[1].strip())
-                            self.lexicon[word] = score
-                        except ValueError:
-                            continue
+            # Parse seluruh file sekaligus dengan parser C pandas; baris
+            # tanpa skor integer yang valid dilewati seperti sebelumnya
+            # (keep_default_na=False agar kata seperti "nan"/"null" tetap kata)
+            table = pd.read_csv(
+                lexicon_path, header=None, names=['word', 'score'], usecols=[0, 1],
+                dtype=str, encoding='utf-8', engine='c', keep_default_na=False,
+                on_bad_lines='skip'
+            )
+            scores = pd.to_numeric(table['score'].str.strip(), errors='coerce')
+            valid = scores.notna()
+            words = table['word'][valid].str.strip().str.lower()
+            self._lexicon = dict(zip(words, scores[valid].astype(np.int64).tolist()))
 
             print(f"Loaded {len(self.lexicon)} words from lexicon")
+            self._build_lexicon_arrays()
 
         except Exception as e:
             print(f"Error loading lexicon: {str(e)}")
 
+    def _build_lexicon_arrays(self):
+        """
+        Simpan lexicon sebagai dua array paralel (index kata + skor) untuk
+        scoring vektor di analyze_dataframe.
+
+        Array skor diberi satu elemen 0 tambahan di akhir, sehingga posisi
+        -1 dari get_indexer (kata tidak ada di lexicon) langsung bernilai 0.
+        Skor disimpan sebagai int8 (skor lexicon berkisar -5..5); int16
+        dipakai hanya jika ada skor di luar rentang int8.
+        """
+        scores = np.fromiter(self.lexicon.values(), dtype=np.int64, count=len(self.lexicon))
+        int8_info = np.iinfo(np.int8)
+        fits_int8 = scores.size == 0 or (scores.min() >= int8_info.min and scores.max() <= int8_info.max)
+
+        self._lexicon_index = pd.Index(list(self.lexicon.keys()), dtype=object)
+        self._lexicon_scores = np.append(scores, 0).astype(np.int8 if fits_int8 else np.int16)
+
+    def _score_lowered_text(self, lowered: str) -> int:
+        """
+        Jumlahkan skor lexicon dari text yang sudah di-lowercase.
+
+        Args:
+            lowered (str): Text tweet dalam huruf kecil
+
+        Returns:
+            int: Total skor sentimen
+        """
+        lexicon_get = self.lexicon.get
+        return sum(lexicon_get(word, 0) for word in self._TOKEN_RE.findall(lowered))
+
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
         Analisis sentimen dari satu text menggunakan lexicon scoring.
@@ -91,17 +154,9 @@ class SentimentAnalyzer:
             }
 
         try:
-            # Tokenisasi sederhana: lowercase dan ambil kata-kata saja
-            words = re.findall(r'\w+', text.lower())
-
-            score = 0
-            matched_words = []
-
-            for word in words:
-                if word in self.lexicon:
-                    word_score = self.lexicon[word]
-                    score += word_score
-                    matched_words.append(f"{word}({word_score})")
+            # Retweet/quote yang identik (setelah lowercase) langsung
+            # mengambil skor dari cache tanpa tokenisasi ulang
+            score = self._score_lowered(text.lower())
 
             # Klasifikasi berdasarkan total score
             if score > 0:
@@ -115,8 +170,6 @@ class SentimentAnalyzer:
                 'polarity': score,
                 'subjectivity': 0.0, # Lexicon doesn't provide subjectivity
                 'label': label,
-                # Optional: debug info
-                # 'matched_words': matched_words
             }
         except Exception as e:
             print(f"Error in analyze_text: {e}")
@@ -137,20 +190,56 @@ class SentimentAnalyzer:
 
         Returns:
             pd.DataFrame: DataFrame dengan kolom tambahan:
-                - sentiment_polarity
-                - sentiment_subjectivity
-                - sentiment_label
+                - sentiment_polarity (int16, int32 untuk text sangat panjang)
+                - sentiment_label (category: Negatif/Netral/Positif)
+
+            Subjectivity tidak disimpan sebagai kolom karena pendekatan
+            lexicon selalu menghasilkan 0.0 (lihat analyze_text).
         """
         if text_column not in df.columns:
             raise ValueError(f"Column '{text_column}' not found in DataFrame")
 
-        # Analisis setiap tweet
-        sentiments = df[text_column].apply(self.analyze_text)
-
-        # Extract ke kolom terpisah
-        df['sentiment_polarity'] = sentiments.apply(lambda x: x['polarity'])
-        df['sentiment_subjectivity'] = sentiments.apply(lambda x: x['subjectivity'])
-        df['sentiment_label'] = sentiments.apply(lambda x: x['label'])
+        self._ensure_lexicon()
+
+        # Retweet/duplikat membuat banyak text identik: skor hanya dihitung
+        # sekali per text unik lalu dipetakan balik lewat kode factorize
+        codes, unique_texts = pd.factorize(df[text_column])
+
+        # Tokenisasi semua text unik sekaligus lalu explode menjadi satu kata
+        # per baris (index = posisi text unik). Nilai non-string menjadi
+        # NaN sehingga skornya 0 (sama seperti analyze_text).
+        words = (
+            pd.Series(unique_texts, dtype=object)
+            .str.lower()
+            .str.findall(self._TOKEN_RE)
+            .explode()
+        )
+
+        # Lookup skor lewat array lexicon, lalu jumlahkan per text unik
+        positions = self._lexicon_index.get_indexer(words)
+        scores = self._lexicon_scores[positions]
+        unique_polarity = np.bincount(
+            words.index.to_numpy(), weights=scores, minlength=len(unique_texts)
+        )
+
+        # Total skor per tweet muat di int16 untuk tweet normal; fallback
+        # ke int32 jika ada text sangat panjang yang melebihi rentangnya
+        int16_info = np.iinfo(np.int16)
+        fits_int16 = unique_polarity.size == 0 or (
+            unique_polarity.min() >= int16_info.min and unique_polarity.max() <= int16_info.max
+        )
+        unique_polarity = unique_polarity.astype(np.int16 if fits_int16 else np.int32)
+
+        # Kode -1 (nilai kosong/NaN) mendapat skor 0
+        polarity = np.append(unique_polarity, unique_polarity.dtype.type(0))[codes]
+
+        df['sentiment_polarity'] = polarity
+
+        # Label diturunkan langsung dari tanda polarity sebagai kode
+        # Categorical, tanpa membangun array string sepanjang DataFrame
+        df['sentiment_label'] = pd.Categorical.from_codes(
+            np.sign(polarity).astype(np.int8) + 1, categories=self._LABELS
+        )
 
         return df
 
@@ -175,10 +264,13 @@ class SentimentAnalyzer:
         if 'sentiment_label' not in df.columns:
             raise ValueError("DataFrame belum dianalisis. Jalankan analyze_dataframe() terlebih dahulu")
 
+        # Satu pass value_counts menggantikan tiga boolean mask; label
+        # categorical dihitung dari kode integer tanpa perlu sorting
         total = len(df)
-        positif = len(df[df['sentiment_label'] == 'Positif'])
-        negatif = len(df[df['sentiment_label'] == 'Negatif'])
-        netral = len(df[df['sentiment_label'] == 'Netral'])
+        counts = df['sentiment_label'].value_counts(sort=False)
+        positif = int(counts.get('Positif', 0))
+        negatif = int(counts.get('Negatif', 0))
+        netral = int(counts.get('Netral', 0))
 
         return {
             'total_tweets': total,
@@ -188,5 +280,5 @@ class SentimentAnalyzer:
             'positif_percentage': round((positif / total * 100) if total > 0 else 0, 2),
             'negatif_percentage': round((negatif / total * 100) if total > 0 else 0, 2),
             'netral_percentage': round((netral / total * 100) if total > 0 else 0, 2),
-            'avg_polarity': round(df['sentiment_polarity'].mean(), 2) if total > 0 else 0
+            'avg_polarity': round(float(df['sentiment_polarity'].mean()), 2) if total > 0 else 0
         }
@@ -2,12 +2,31 @@
 Trend Detection untuk mengidentifikasi trending topics dan hashtags.
 """
 
+import os
+from pathlib import Path
 from typing import Dict, List, Any, Tuple
 from collections import Counter
 import pandas as pd
 import re
 from datetime import datetime, timedelta
 
+# Pattern dikompilasi sekali di level modul. Pattern hashtag/mention
+# dipakai untuk ekstraksi (findall) sekaligus penghapusan (sub).
+# URL: 'https...' sudah tercakup oleh http\S+; re.MULTILINE tidak relevan
+# karena pattern tidak memakai ^/$. \b\w+\b identik dengan \w+.
+_HASHTAG_RE = re.compile(r'#(\w+)')
+_MENTION_RE = re.compile(r'@(\w+)')
+_URL_RE = re.compile(r'http\S+|www\S+')
+_WORD_RE = re.compile(r'\w+')
+
+# Stopwords dasar jika file lexicon tidak ditemukan / gagal dibaca
+_BASIC_STOPWORDS = frozenset({
+    'yang', 'dan', 'di', 'ke', 'dari', 'untuk', 'pada', 'dengan', 'ini', 'itu',
+    'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
+    'might', 'can', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'with'
+})
+
 
 class TrendDetector:
     """
@@ -39,7 +58,10 @@ class TrendDetector:
         Returns:
             List[str]: List hashtags (tanpa #)
         """
-        hashtags = re.findall(r'#(\w+)', text)
+        # Sebagian besar tweet tanpa '#': cek karakter jauh lebih murah dari regex
+        if '#' not in text:
+            return []
+        hashtags = _HASHTAG_RE.findall(text)
         return [tag.lower() for tag in hashtags]
 
     def extract_mentions(self, text: str) -> List[str]:
@@ -52,7 +74,9 @@ class TrendDetector:
         Returns:
             List[str]: List mentions (tanpa @)
         """
-        mentions = re.findall(r'@(\w+)', text)
+        if '@' not in text:
+            return []
+        mentions = _MENTION_RE.findall(text)
         return [mention.lower() for mention in mentions]
 
     def extract_keywords(self, text: str, min_length: int = 4) -> List[str]:
@@ -66,13 +90,21 @@ class TrendDetector:
         Returns:
             List[str]: List keywords
         """
-        # Remove URLs, hashtags, mentions
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-        text = re.sub(r'#\w+', '', text)
-        text = re.sub(r'@\w+', '', text)
+        # Lowercase sekali di awal; pengecekan prefix dan penghapusan URL
+        # juga menangkap varian kapital seperti "Http://" atau "WWW."
+        text = text.lower()
+
+        # Remove URLs, hashtags, mentions (regex hanya dijalankan jika
+        # karakter/prefix yang bersangkutan memang ada di text)
+        if 'http' in text or 'www' in text:
+            text = _URL_RE.sub('', text)
+        if '#' in text:
+            text = _HASHTAG_RE.sub('', text)
+        if '@' in text:
+            text = _MENTION_RE.sub('', text)
 
         # Extract words
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = _WORD_RE.findall(text)
 
         # Load stopwords dari modified-lexicon_v2.txt
         stopwords = self._load_stopwords()
@@ -80,21 +112,22 @@ class TrendDetector:
         keywords = [word for word in words if len(word) >= min_length and word not in stopwords]
         return keywords
 
-    def _load_stopwords(self) -> set:
+    def _load_stopwords(self) -> frozenset:
         """
-        Load basic stopwords (fallback/hardcoded list).
-        Previously attempted to load from modified-lexicon_v2.txt which was incorrect.
+        Load stopwords dari modified-lexicon_v2.txt (fallback ke daftar dasar).
+
+        Kata di-lowercase sekali saat load, sehingga extract_keywords cukup
+        melakukan membership test pada token yang sudah lowercase.
 
         Returns:
-            set: Set of stopwords
+            frozenset: Set stopwords (immutable, di-cache per instance)
         """
         # Use cache if available
         if self._stopwords_cache is not None:
             return self._stopwords_cache
 
-        stopwords = set()
+        stopwords = _BASIC_STOPWORDS
         try:
-            import os
             # Try to find the file in current directory or parent directory
             possible_paths = [
                 'modified-lexicon_v2.txt',
@@ -103,36 +136,19 @@ class TrendDetector:
                 os.path.join(os.path.dirname(__file__), '../../modified-lexicon_v2.txt')
             ]
 
-            lexicon_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    lexicon_path = path
-                    break
+            lexicon_path = next((path for path in possible_paths if os.path.exists(path)), None)
 
             if lexicon_path:
-                with open(lexicon_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and ',' in line:
-                            word = line.split(',')[0].strip()
-                            if word:
-                                stopwords.add(word.lower())
-            else:
-                # Fallback ke basic stopwords jika file tidak ditemukan
-                stopwords = {
-                    'yang', 'dan', 'di', 'ke', 'dari', 'untuk', 'pada', 'dengan', 'ini', 'itu',
-                    'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
-                    'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
-                    'might', 'can', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'with'
-                }
-        except Exception as e:
+                # Baca seluruh file sekaligus lalu ambil kolom kata per baris
+                lines = Path(lexicon_path).read_text(encoding='utf-8').splitlines()
+                stopwords = frozenset(
+                    word for word in (
+                        line.split(',', 1)[0].strip().lower() for line in lines if ',' in line
+                    ) if word
+                )
+        except Exception:
             # Fallback ke basic stopwords jika ada error
-            stopwords = {
-                'yang', 'dan', 'di', 'ke', 'dari', 'untuk', 'pada', 'dengan', 'ini', 'itu',
-                'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has',
-                'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
-                'might', 'can', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'with'
-        }
+            stopwords = _BASIC_STOPWORDS
 
         # Cache the result
         self._stopwords_cache = stopwords
@@ -195,6 +211,51 @@ class TrendDetector:
         counter = Counter(all_keywords)
         return counter.most_common(top_n)
 
+    def _tally(self, df: pd.DataFrame, text_column: str = 'tweet_text') -> Tuple[Counter, Counter, Counter]:
+        """
+        Hitung hashtags, mentions, dan keywords dalam satu pass atas text unik.
+
+        Args:
+            df (pd.DataFrame): DataFrame berisi tweet
+            text_column (str): Nama kolom text
+
+        Returns:
+            Tuple[Counter, Counter, Counter]: Counter hashtags, mentions, keywords
+        """
+        # Retweet/duplikat: setiap text unik hanya ditokenisasi sekali, lalu
+        # hasilnya dikalikan jumlah kemunculannya. Counter mempertahankan
+        # urutan kemunculan pertama, jadi urutan hasil seri tetap sama.
+        text_counts = Counter(map(str, df[text_column].to_numpy()))
+
+        hashtags, mentions, keywords = Counter(), Counter(), Counter()
+        for text, occurrences in text_counts.items():
+            for counter, extract in (
+                (hashtags, self.extract_hashtags),
+                (mentions, self.extract_mentions),
+                (keywords, self.extract_keywords),
+            ):
+                tokens = extract(text)
+                counter.update(tokens if occurrences == 1 else tokens * occurrences)
+        return hashtags, mentions, keywords
+
+    @staticmethod
+    def _top_series(counter: Counter, n: int) -> pd.Series:
+        """
+        Ambil n item teratas dari Counter sebagai pd.Series int64.
+
+        Sort stable sehingga urutan item dengan count sama identik dengan
+        Counter.most_common (urutan kemunculan pertama).
+
+        Args:
+            counter (Counter): Counter hasil _tally
+            n (int): Jumlah item teratas
+
+        Returns:
+            pd.Series: Count per label, terurut menurun
+        """
+        series = pd.Series(counter, dtype='int64')
+        return series.sort_values(ascending=False, kind='stable').head(n)
+
     def detect_spike(self, df: pd.DataFrame, timestamp_column: str = 'timestamp', window_hours: int = 1) -> Dict[str, Any]:
         """
         Deteksi spike (lonjakan) volume tweet.
@@ -214,12 +275,13 @@ class TrendDetector:
         if timestamp_column not in df.columns:
             return {'has_spike': False, 'error': 'Timestamp column not found'}
 
-        # Convert to datetime
-        df['_temp_timestamp'] = pd.to_datetime(df[timestamp_column])
-
-        # Group by time window
-        df['_temp_window'] = df['_temp_timestamp'].dt.floor(f'{window_hours}H')
-        window_counts = df.groupby('_temp_window').size()
+        # Hitung jumlah tweet per window dari Series lokal (DataFrame caller
+        # tidak diubah); timestamp yang tidak valid menjadi NaT dan diabaikan
+        timestamps = pd.to_datetime(df[timestamp_column], errors='coerce')
+        windows = timestamps.dt.floor(pd.Timedelta(hours=window_hours))
+        # sort_index: jika ada beberapa peak sama besar, idxmax memilih
+        # window paling awal (sama seperti groupby sebelumnya)
+        window_counts = windows.value_counts(sort=False).sort_index()
 
         if len(window_counts) == 0:
             return {'has_spike': False}
@@ -255,10 +317,16 @@ class TrendDetector:
                 - top_mentions: Top 10 mentions
                 - top_keywords: Top 20 keywords
                 - spike_info: Informasi spike detection
+
+            Top-N berupa pd.Series (index = label, value = count int64)
+            terurut dari count terbesar.
         """
+        # Satu pass untuk ketiga counter, bukan tiga iterasi DataFrame terpisah
+        hashtags, mentions, keywords = self._tally(df, text_column)
+
         return {
-            'top_hashtags': self.get_top_hashtags(df, top_n=10, text_column=text_column),
-            'top_mentions': self.get_top_mentions(df, top_n=10, text_column=text_column),
-            'top_keywords': self.get_top_keywords(df, top_n=20, text_column=text_column),
+            'top_hashtags': self._top_series(hashtags, 10),
+            'top_mentions': self._top_series(mentions, 10),
+            'top_keywords': self._top_series(keywords, 20),
             'spike_info': self.detect_spike(df) if 'timestamp' in df.columns else {'has_spike': False}
         }
@@ -20,6 +20,9 @@ SESSION_INTERVAL_WAIT = 10
 MAX_SCROLL_ATTEMPTS_WITHOUT_CHANGE = 3
 """int: Maksimal percobaan scroll tanpa perubahan tinggi halaman sebelum berhenti"""
 
+SESSION_HISTORY_SIZE = 256
+"""int: Jumlah sesi terakhir yang disimpan ProgressTracker untuk statistik durasi/kecepatan"""
+
 
 # ==================== Database Configuration ====================
 # Konfigurasi untuk sistem deduplication database
@@ -34,6 +37,42 @@ Semakin tinggi = semakin strict"""
 DEFAULT_CLEANUP_DAYS = 30
 """int: Jumlah hari untuk menyimpan data lama sebelum dibersihkan otomatis"""
 
+DEDUP_INSERT_BATCH_SIZE = 100
+"""int: Jumlah tweet yang ditampung sebelum di-INSERT sekaligus dalam satu transaksi"""
+
+BLOOM_FILTER_BITS = 1 << 23
+"""int: Ukuran bloom filter deduplication dalam bit (1 MiB memory)"""
+
+BLOOM_FILTER_HASHES = 3
+"""int: Jumlah fungsi hash per item pada bloom filter deduplication"""
+
+SQLITE_CACHED_STATEMENTS = 256
+"""int: Ukuran cache prepared statement per koneksi SQLite deduplication"""
+
+
+# ==================== Export Configuration ====================
+# Konfigurasi untuk file hasil scraping
+
+TWEET_FIELDS = (
+    'username',
+    'handle',
+    'timestamp',
+    'tweet_text',
+    'url',
+    'reply_count',
+    'retweet_count',
+    'like_count'
+)
+"""tuple: Urutan kolom data tweet pada file export"""
+
+EXPORT_EXTENSIONS = {
+    'CSV': '.csv',
+    'JSON': '.json',
+    'Excel': '.xlsx',
+    'Parquet': '.parquet'
+}
+"""dict: Ekstensi file untuk setiap format export"""
+
 
 # ==================== User Agent ====================
 # User agent untuk WebDriver agar terlihat seperti browser normal
@@ -56,3 +95,18 @@ MIN_LEFT_PANEL_WIDTH = 768
 
 MAX_LEFT_PANEL_WIDTH = 1366
 """int: Lebar maksimum panel kiri (pixels)"""
+
+STATS_REFRESH_INTERVAL_MS = 200
+"""int: Interval refresh statistik & progress bar di GUI (milliseconds, 5 Hz)"""
+
+LOG_FLUSH_INTERVAL_MS = 100
+"""int: Interval penulisan log yang di-buffer ke panel Log (milliseconds, 10 Hz)"""
+
+LOG_BUFFER_SIZE = 2000
+"""int: Maksimum baris log tertunda per flush; baris tertua dibuang jika lebih"""
+
+LOG_MAX_BLOCKS = 5000
+"""int: Jumlah baris maksimum di panel Log; baris tertua dibuang otomatis oleh Qt"""
+
+THEME_SAVE_DELAY_MS = 500
+"""int: Jeda sebelum pilihan tema ditulis ke QSettings; toggle beruntun digabung (milliseconds)"""
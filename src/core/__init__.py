@@ -2,6 +2,6 @@
 
 from .deduplicator import AdvancedDeduplicator
 from .progress_tracker import ProgressTracker
-from .theme_manager import ThemeManager
+from .theme_manager import ThemeManager, get_theme_manager
 
-__all__ = ['AdvancedDeduplicator', 'ProgressTracker', 'ThemeManager']
+__all__ = ['AdvancedDeduplicator', 'ProgressTracker', 'ThemeManager', 'get_theme_manager']
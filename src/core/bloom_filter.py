@@ -0,0 +1,70 @@
+"""
+Bloom filter sederhana untuk prefilter pengecekan duplikat.
+"""
+
+from typing import Hashable, Iterable
+
+
+class BloomFilter:
+    """
+    Bloom filter berbasis bytearray untuk membership test yang cepat.
+
+    Jawaban "tidak ada" selalu benar, sedangkan jawaban "mungkin ada"
+    bisa false positive sehingga tetap perlu dikonfirmasi ke database.
+    Posisi bit diturunkan dari hash() bawaan Python dengan double hashing,
+    sehingga filter hanya valid dalam satu proses (dibangun ulang saat start).
+
+    Attributes:
+        num_bits (int): Jumlah bit dalam filter
+        num_hashes (int): Jumlah posisi bit per item
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int):
+        """
+        Inisialisasi BloomFilter kosong.
+
+        Args:
+            num_bits (int): Jumlah bit dalam filter
+            num_hashes (int): Jumlah posisi bit per item
+        """
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    def _positions(self, item: Hashable):
+        """Hitung posisi bit untuk item menggunakan double hashing."""
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: Hashable):
+        """Tambahkan item ke filter."""
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, items: Iterable[Hashable]):
+        """Tambahkan banyak item sekaligus (misalnya saat memuat dari database)."""
+        bits = self._bits
+        positions = self._positions
+        for item in items:
+            for pos in positions(item):
+                bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: Hashable) -> bool:
+        """Return False jika item pasti belum pernah ditambahkan."""
+        # Posisi dihitung inline (tanpa generator _positions): dipanggil
+        # hingga tiga kali per tweet dan item baru biasanya sudah keluar
+        # di posisi pertama
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        bits = self._bits
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            pos = (h1 + i * h2) % num_bits
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
@@ -3,11 +3,70 @@ Advanced deduplication system for tweets with multiple detection methods.
 """
 
 import hashlib
+import re
 import sqlite3
-from typing import Dict, Any, Set
-from difflib import SequenceMatcher
+import threading
+from typing import Dict, Any, List, Set, Tuple
+
+from ..config.constants import (
+    DEFAULT_DB_PATH,
+    DEFAULT_SIMILARITY_THRESHOLD,
+    DEDUP_INSERT_BATCH_SIZE,
+    BLOOM_FILTER_BITS,
+    BLOOM_FILTER_HASHES,
+    SQLITE_CACHED_STATEMENTS
+)
+from .bloom_filter import BloomFilter
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# ID status tweet; URL yang sama bisa muncul dengan host berbeda
+# (x.com, twitter.com, mobile.twitter.com), query tracking (?s=20),
+# atau path /i/web/status/...
+_STATUS_RE = re.compile(r'/status/(\d+)')
+
+_INT64_SIGN_BIT = 1 << 63
+_UINT64_RANGE = 1 << 64
+
+
+def hash64(data: bytes) -> int:
+    """
+    Hitung digest 64-bit non-kriptografis sebagai signed integer.
+
+    Menggunakan xxh3 jika xxhash terinstall, fallback ke blake2b 8-byte.
+    Hasil signed agar muat di kolom INTEGER SQLite.
+
+    Args:
+        data (bytes): Data yang akan di-hash
+
+    Returns:
+        int: Digest 64-bit dalam rentang signed int64
+    """
+    if XXHASH_AVAILABLE:
+        # intdigest langsung memberi int (nilai sama dengan digest big-endian),
+        # tanpa objek bytes perantara dan int.from_bytes
+        value = xxhash.xxh3_64_intdigest(data)
+        return value - _UINT64_RANGE if value >= _INT64_SIGN_BIT else value
+    digest = hashlib.blake2b(data, digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def canonical_url_key(url: str) -> str:
+    """
+    Normalisasi URL tweet menjadi ID status-nya.
+
+    Args:
+        url (str): URL tweet
 
-from ..config.constants import DEFAULT_DB_PATH, DEFAULT_SIMILARITY_THRESHOLD
+    Returns:
+        str: ID status jika ditemukan, selain itu URL apa adanya
+    """
+    match = _STATUS_RE.search(url)
+    return match.group(1) if match else url
 
 
 class AdvancedDeduplicator:
@@ -17,18 +76,65 @@ class AdvancedDeduplicator:
     Class ini menggunakan beberapa metode untuk mendeteksi tweet duplikat:
     1. URL hash - Deteksi berdasarkan URL tweet yang sama
     2. Content hash - Deteksi berdasarkan kombinasi text + username (untuk retweet)
-    3. Text hash - Deteksi berdasarkan kemiripan teks menggunakan SequenceMatcher
+    3. Text hash - Deteksi berdasarkan teks yang sama setelah normalisasi
 
     Data disimpan dalam SQLite database untuk persistent storage dan
-    juga di-cache dalam memory untuk performa lebih cepat.
+    juga di-cache dalam memory untuk performa lebih cepat. Satu koneksi
+    SQLite (mode WAL) dipakai selama umur object dan dilindungi lock
+    sehingga aman diakses dari beberapa thread. Insert ditampung lalu
+    ditulis per batch dalam satu transaksi. Bloom filter in-memory berisi
+    semua hash yang tersimpan, sehingga tweet baru tidak perlu query ke
+    database sama sekali.
 
     Attributes:
         db_path (str): Path ke file database SQLite
         similarity_threshold (float): Threshold untuk similarity matching (0-1)
-        session_hashes (Set[str]): Cache hash URL dalam sesi saat ini
-        session_urls (Set[str]): Cache URL dalam sesi saat ini
+        session_url_hashes (Set[int]): Cache hash URL dalam sesi saat ini
+        batch_size (int): Jumlah tweet per batch INSERT
     """
 
+    # Versi skema (PRAGMA user_version); versi 1 = url_hash dari ID status
+    _SCHEMA_VERSION = 1
+
+    # SQL disimpan sebagai konstanta kelas agar string yang sama selalu
+    # dipakai ulang dan statement-nya diambil dari cache koneksi
+    _SQL_CREATE_TABLE = '''
+        CREATE TABLE IF NOT EXISTS tweet_hashes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url_hash INTEGER UNIQUE,
+            content_hash INTEGER,
+            text_hash INTEGER,
+            url TEXT,
+            username TEXT,
+            timestamp TEXT,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    '''
+
+    _SQL_INSERT = '''
+        INSERT OR IGNORE INTO tweet_hashes
+        (url_hash, content_hash, text_hash, url, username, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+
+    # Satu query terindeks untuk ketiga hash; ORDER BY menjaga
+    # prioritas URL > konten > teks jika beberapa baris cocok
+    _SQL_CHECK_DUP = '''
+        SELECT url_hash, content_hash, username FROM tweet_hashes
+        WHERE url_hash = ? OR content_hash = ? OR text_hash = ?
+        ORDER BY url_hash = ? DESC, content_hash = ? DESC
+        LIMIT 1
+    '''
+
+    _SQL_REHASH_URL = "UPDATE OR REPLACE tweet_hashes SET url_hash = ? WHERE id = ?"
+
+    _SQL_COUNT = "SELECT COUNT(*) FROM tweet_hashes"
+
+    _SQL_CLEANUP = '''
+        DELETE FROM tweet_hashes
+        WHERE created_at < datetime('now', ?)
+    '''
+
     def __init__(self, db_path: str = DEFAULT_DB_PATH, similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD):
         """
         Inisialisasi AdvancedDeduplicator dengan konfigurasi database dan threshold.
@@ -40,52 +146,180 @@ class AdvancedDeduplicator:
                 Nilai 0-1, semakin tinggi semakin strict. Default: 0.85
 
         Note:
-            Database akan dibuat otomatis jika belum ada.
+            Database akan dibuat otomatis jika belum ada. Panggil close()
+            setelah selesai agar koneksi database ditutup.
         """
         self.db_path = db_path
         self.similarity_threshold = similarity_threshold
-        self.session_hashes: Set[str] = set()
-        self.session_urls: Set[str] = set()
+        self.session_url_hashes: Set[int] = set()
+        self.batch_size = DEDUP_INSERT_BATCH_SIZE
+        self._pending: List[Tuple[Any, ...]] = []
+        self._pending_url_hashes: Set[int] = set()
+        self._pending_content_hashes: Set[int] = set()
+        self._pending_text_users: Dict[int, str] = {}
+        self._bloom = BloomFilter(BLOOM_FILTER_BITS, BLOOM_FILTER_HASHES)
+        self._conn = None
+        self._lock = threading.Lock()
         self.init_database()
 
     def init_database(self):
         """
         Inisialisasi database SQLite untuk persistent storage.
 
-        Membuat tabel 'tweet_hashes' jika belum ada dengan kolom:
+        Membuka koneksi persistent dengan mode WAL, lalu membuat tabel
+        'tweet_hashes' jika belum ada dengan kolom:
         - id: Primary key auto increment
-        - url_hash: Hash MD5 dari URL (unique)
-        - content_hash: Hash MD5 dari text + username
-        - text_hash: Hash MD5 dari text saja
+        - url_hash: Hash 64-bit dari URL (unique)
+        - content_hash: Hash 64-bit dari text + username
+        - text_hash: Hash 64-bit dari text saja
         - url: URL tweet original
         - username: Username pembuat tweet
         - timestamp: Timestamp tweet
         - created_at: Waktu data disimpan ke database
 
+        Index dibuat untuk content_hash dan text_hash agar pengecekan
+        duplikat tidak melakukan full table scan, serta untuk created_at
+        agar cleanup_old_entries hanya menyentuh baris yang kedaluwarsa. Database lama dengan hash
+        MD5 (kolom TEXT) atau url_hash dari URL penuh dimigrasikan otomatis.
+
         Raises:
             Exception: Jika gagal membuat/koneksi ke database
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS tweet_hashes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    url_hash TEXT UNIQUE,
-                    content_hash TEXT,
-                    text_hash TEXT,
-                    url TEXT,
-                    username TEXT,
-                    timestamp TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            conn.commit()
-            conn.close()
+            self._conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=SQLITE_CACHED_STATEMENTS
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-20000")
+            self._migrate_legacy_schema()
+            self._conn.execute(self._SQL_CREATE_TABLE)
+            self._rehash_url_keys()
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_content_hash ON tweet_hashes(content_hash)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_text_hash ON tweet_hashes(text_hash)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_created_at ON tweet_hashes(created_at)")
+
+            # Isi bloom filter dari hash yang sudah tersimpan
+            self._bloom.update(
+                value
+                for row in self._conn.execute("SELECT url_hash, content_hash, text_hash FROM tweet_hashes")
+                for value in row
+                if value is not None
+            )
         except Exception as e:
             print(f"Error initializing database: {e}")
 
-    def generate_hashes(self, tweet_data: Dict[str, Any]) -> Dict[str, str]:
+    def _migrate_legacy_schema(self):
+        """
+        Migrasi tabel lama (hash MD5 TEXT) ke skema hash INTEGER.
+
+        url_hash dihitung ulang dari kolom url. Teks tweet tidak disimpan,
+        sehingga content_hash dan text_hash baris lama diisi NULL.
+        """
+        columns = {row[1]: row[2] for row in self._conn.execute("PRAGMA table_info(tweet_hashes)")}
+        if columns.get('url_hash', '').upper() != 'TEXT':
+            return
+
+        rows = self._conn.execute(
+            "SELECT url, username, timestamp, created_at FROM tweet_hashes"
+        ).fetchall()
+
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute("DROP TABLE tweet_hashes")
+            self._conn.execute(self._SQL_CREATE_TABLE)
+            self._conn.executemany('''
+                INSERT OR IGNORE INTO tweet_hashes (url_hash, url, username, timestamp, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', [
+                (hash64(canonical_url_key(url or '').encode('utf-8')), url, username, timestamp, created_at)
+                for url, username, timestamp, created_at in rows
+            ])
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _rehash_url_keys(self):
+        """
+        Hitung ulang url_hash dari ID status untuk database versi lama.
+
+        Baris yang ternyata merujuk tweet yang sama digabung (UPDATE OR
+        REPLACE), lalu user_version dinaikkan agar hanya berjalan sekali.
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= self._SCHEMA_VERSION:
+            return
+
+        rows = self._conn.execute("SELECT id, url FROM tweet_hashes").fetchall()
+
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(self._SQL_REHASH_URL, [
+                (hash64(canonical_url_key(url or '').encode('utf-8')), row_id)
+                for row_id, url in rows
+            ])
+            self._conn.execute(f"PRAGMA user_version = {self._SCHEMA_VERSION}")
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        """
+        Tutup koneksi database persistent.
+
+        Batch yang masih tertunda ditulis terlebih dahulu. Aman dipanggil
+        berkali-kali; setelah ditutup, operasi database akan gagal dan
+        ditangani sebagai error biasa.
+        """
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    # Perbarui statistik index (hanya jika perlu) agar
+                    # query planner tetap memilih index hash
+                    self._conn.execute("PRAGMA optimize")
+                    self._conn.close()
+                except Exception as e:
+                    print(f"Error closing database: {e}")
+                self._conn = None
+
+    def flush(self):
+        """
+        Tulis semua tweet yang tertunda ke database dalam satu transaksi.
+
+        Dipanggil otomatis saat batch penuh, sebelum get_stats/cleanup,
+        dan saat close(). Panggil manual di akhir sesi scraping.
+        """
+        try:
+            with self._lock:
+                self._flush_pending()
+        except Exception as e:
+            print(f"Error flushing pending tweets: {e}")
+
+    def _flush_pending(self):
+        """Flush batch tertunda; pemanggil harus memegang self._lock."""
+        if not self._pending or self._conn is None:
+            return
+
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(self._SQL_INSERT, self._pending)
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._pending.clear()
+        self._pending_url_hashes.clear()
+        self._pending_content_hashes.clear()
+        self._pending_text_users.clear()
+
+    def generate_hashes(self, tweet_data: Dict[str, Any]) -> Dict[str, int]:
         """
         Generate multiple types of hashes untuk comprehensive deduplication.
 
@@ -97,27 +331,30 @@ class AdvancedDeduplicator:
                 - timestamp: Waktu tweet
 
         Returns:
-            Dict[str, str]: Dictionary berisi 3 jenis hash:
-                - url_hash: MD5 hash dari URL (identifier utama)
-                - content_hash: MD5 hash dari text+username (deteksi retweet)
-                - text_hash: MD5 hash dari text saja (deteksi konten serupa)
+            Dict[str, int]: Dictionary berisi 3 jenis hash 64-bit:
+                - url_hash: Hash dari ID status URL (identifier utama)
+                - content_hash: Hash dari text+username (deteksi retweet)
+                - text_hash: Hash dari text saja (deteksi konten serupa)
 
         """
         url = tweet_data.get('url', '')
         text = tweet_data.get('tweet_text', '')
         username = tweet_data.get('username', '')
-        timestamp = tweet_data.get('timestamp', '')
 
-        # URL hash (primary identifier)
-        url_hash = hashlib.md5(url.encode('utf-8')).hexdigest()
+        # Lowercase sekali, dipakai untuk content hash dan text hash
+        text_lower = text.lower()
+
+        # URL hash (primary identifier), dari ID status agar varian URL
+        # untuk tweet yang sama menghasilkan hash yang sama
+        url_hash = hash64(canonical_url_key(url).encode('utf-8'))
 
         # Content hash (text + username for retweet detection)
-        content_data = f"{text.lower().strip()}{username}"
-        content_hash = hashlib.md5(content_data.encode('utf-8')).hexdigest()
+        content_data = f"{text_lower.strip()}{username}"
+        content_hash = hash64(content_data.encode('utf-8'))
 
         # Text-only hash (for similar content detection)
-        text_normalized = ' '.join(text.lower().split())  # Normalize whitespace
-        text_hash = hashlib.md5(text_normalized.encode('utf-8')).hexdigest()
+        text_normalized = ' '.join(text_lower.split())  # Normalize whitespace
+        text_hash = hash64(text_normalized.encode('utf-8'))
 
         return {
             'url_hash': url_hash,
@@ -125,9 +362,26 @@ class AdvancedDeduplicator:
             'text_hash': text_hash
         }
 
+    def generate_hashes_batch(self, tweets: List[Dict[str, Any]]) -> List[Dict[str, int]]:
+        """
+        Generate hash untuk satu batch tweet hasil harvest.
+
+        Hasilnya bisa diteruskan ke is_duplicate() dan add_tweet() lewat
+        parameter hashes, sehingga setiap tweet cukup di-hash sekali.
+
+        Args:
+            tweets (List[Dict[str, Any]]): List dictionary data tweet
+
+        Returns:
+            List[Dict[str, int]]: Hash per tweet, urutan sama dengan input
+        """
+        generate = self.generate_hashes
+        return [generate(tweet_data) for tweet_data in tweets]
+
     def is_similar_text(self, text1: str, text2: str) -> bool:
         """
-        Menggunakan SequenceMatcher dari difflib untuk menghitung similarity ratio.
+        Hitung kemiripan dua text dengan Jaccard similarity atas shingle
+        3 karakter (O(n), berbeda dengan SequenceMatcher yang O(n*m)).
         Text dinormalisasi (lowercase, whitespace) sebelum dibandingkan.
 
         Args:
@@ -147,74 +401,91 @@ class AdvancedDeduplicator:
         text1_norm = ' '.join(text1.lower().split())
         text2_norm = ' '.join(text2.lower().split())
 
-        # Calculate similarity ratio
-        similarity = SequenceMatcher(None, text1_norm, text2_norm).ratio()
+        if text1_norm == text2_norm:
+            return True
+
+        # Calculate Jaccard similarity over character shingles
+        shingles1 = {text1_norm[i:i + 3] for i in range(max(len(text1_norm) - 2, 1))}
+        shingles2 = {text2_norm[i:i + 3] for i in range(max(len(text2_norm) - 2, 1))}
+        size1, size2 = len(shingles1), len(shingles2)
+
+        # Jaccard <= min/max ukuran set: pasangan yang panjangnya terlalu
+        # berbeda ditolak tanpa menghitung irisan
+        if min(size1, size2) < self.similarity_threshold * max(size1, size2):
+            return False
+
+        # |A | B| = |A| + |B| - |A & B|, tanpa membangun set union
+        intersection = len(shingles1 & shingles2)
+        similarity = intersection / (size1 + size2 - intersection)
         return similarity >= self.similarity_threshold
 
-    def is_duplicate(self, tweet_data: Dict[str, Any]) -> tuple[bool, str]:
+    def is_duplicate(self, tweet_data: Dict[str, Any], hashes: Dict[str, int] = None) -> tuple[bool, str]:
         """
         Check if tweet is duplicate using multiple methods.
 
         Args:
             tweet_data (Dict[str, Any]): Dictionary berisi data tweet
+            hashes (Dict[str, int], optional): Hash yang sudah dihitung
+                (dari generate_hashes_batch); dihitung ulang jika None
 
         Returns:
             tuple[bool, str]: Tuple berisi:
                 - bool: True jika tweet duplikat, False jika tidak
                 - str: Alasan duplikasi (misal: "URL duplikat", "Tweet serupa")
         """
-        hashes = self.generate_hashes(tweet_data)
-        url = tweet_data.get('url', '')
-        text = tweet_data.get('tweet_text', '')
+        if hashes is None:
+            hashes = self.generate_hashes(tweet_data)
 
         # 1. Check session-level duplicates (in-memory)
-        if hashes['url_hash'] in self.session_hashes:
+        if hashes['url_hash'] in self.session_url_hashes:
             return True, "URL sudah ada dalam sesi ini"
 
-        if url in self.session_urls:
-            return True, "URL duplikat dalam sesi"
-
         # 2. Check database for persistent duplicates
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Check URL hash
-            cursor.execute("SELECT url FROM tweet_hashes WHERE url_hash = ?", (hashes['url_hash'],))
-            if cursor.fetchone():
-                conn.close()
-                return True, "URL sudah ada dalam database"
-
-            # Check content hash (exact content match)
-            cursor.execute("SELECT url FROM tweet_hashes WHERE content_hash = ?", (hashes['content_hash'],))
-            if cursor.fetchone():
-                conn.close()
-                return True, "Konten identik ditemukan"
-
-            # Check for similar text content
-            cursor.execute("SELECT url, username, timestamp FROM tweet_hashes WHERE text_hash = ?", (hashes['text_hash'],))
-            similar_tweets = cursor.fetchall()
-
-            for similar_url, similar_username, similar_timestamp in similar_tweets:
-                # Additional similarity check for text_hash matches
-                cursor.execute("SELECT url FROM tweet_hashes WHERE url = ?", (similar_url,))
-                if cursor.fetchone():
-                    conn.close()
-                    return True, f"Teks serupa ditemukan dari @{similar_username}"
-
-            conn.close()
+            with self._lock:
+                # Bloom filter: jika tidak ada hash yang "mungkin ada",
+                # tweet pasti belum tersimpan (termasuk di pending batch)
+                if (hashes['url_hash'] not in self._bloom
+                        and hashes['content_hash'] not in self._bloom
+                        and hashes['text_hash'] not in self._bloom):
+                    return False, ""
+
+                # Check pending batch yang belum ditulis ke database
+                # (lookup O(1), prioritas sama dengan query database)
+                if hashes['url_hash'] in self._pending_url_hashes:
+                    return True, "URL sudah ada dalam database"
+                if hashes['content_hash'] in self._pending_content_hashes:
+                    return True, "Konten identik ditemukan"
+                pending_username = self._pending_text_users.get(hashes['text_hash'])
+                if pending_username is not None:
+                    return True, f"Teks serupa ditemukan dari @{pending_username}"
+
+                row = self._conn.execute(self._SQL_CHECK_DUP, (
+                    hashes['url_hash'], hashes['content_hash'], hashes['text_hash'],
+                    hashes['url_hash'], hashes['content_hash']
+                )).fetchone()
+
+                if row:
+                    matched_url_hash, matched_content_hash, matched_username = row
+                    if matched_url_hash == hashes['url_hash']:
+                        return True, "URL sudah ada dalam database"
+                    if matched_content_hash == hashes['content_hash']:
+                        return True, "Konten identik ditemukan"
+                    return True, f"Teks serupa ditemukan dari @{matched_username}"
 
         except Exception as e:
             print(f"Database error during duplicate check: {e}")
 
         return False, ""
 
-    def add_tweet(self, tweet_data: Dict[str, Any]) -> bool:
+    def add_tweet(self, tweet_data: Dict[str, Any], hashes: Dict[str, int] = None) -> bool:
         """
         Add tweet to deduplication system (session cache + database).
 
         Args:
             tweet_data (Dict[str, Any]): Dictionary berisi data tweet
+            hashes (Dict[str, int], optional): Hash yang sudah dihitung
+                (dari generate_hashes_batch); dihitung ulang jika None
 
         Returns:
             bool: True jika berhasil ditambahkan, False jika gagal
@@ -222,32 +493,34 @@ class AdvancedDeduplicator:
         Note:
             Tweet akan ditambahkan ke:
             1. Session cache (in-memory) untuk cek cepat
-            2. Database SQLite untuk persistent storage
+            2. Batch tertunda yang ditulis ke database SQLite setiap
+               batch_size tweet (atau saat flush()/close())
         """
         try:
-            hashes = self.generate_hashes(tweet_data)
+            if hashes is None:
+                hashes = self.generate_hashes(tweet_data)
 
             # Add to session cache
-            self.session_hashes.add(hashes['url_hash'])
-            self.session_urls.add(tweet_data.get('url', ''))
-
-            # Add to database
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR IGNORE INTO tweet_hashes
-                (url_hash, content_hash, text_hash, url, username, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                hashes['url_hash'],
-                hashes['content_hash'],
-                hashes['text_hash'],
-                tweet_data.get('url', ''),
-                tweet_data.get('username', ''),
-                tweet_data.get('timestamp', '')
-            ))
-            conn.commit()
-            conn.close()
+            self.session_url_hashes.add(hashes['url_hash'])
+
+            # Add to pending batch, flush ke database jika sudah penuh
+            with self._lock:
+                self._bloom.add(hashes['url_hash'])
+                self._bloom.add(hashes['content_hash'])
+                self._bloom.add(hashes['text_hash'])
+                self._pending_url_hashes.add(hashes['url_hash'])
+                self._pending_content_hashes.add(hashes['content_hash'])
+                self._pending_text_users.setdefault(hashes['text_hash'], tweet_data.get('username', ''))
+                self._pending.append((
+                    hashes['url_hash'],
+                    hashes['content_hash'],
+                    hashes['text_hash'],
+                    tweet_data.get('url', ''),
+                    tweet_data.get('username', ''),
+                    tweet_data.get('timestamp', '')
+                ))
+                if len(self._pending) >= self.batch_size:
+                    self._flush_pending()
             return True
 
         except Exception as e:
@@ -260,35 +533,30 @@ class AdvancedDeduplicator:
 
         Returns:
             Dict[str, int]: Dictionary berisi statistik:
-                - session_count: Jumlah hash dalam session cache
+                - session_count: Jumlah URL hash dalam session cache
                 - total_stored: Total tweet tersimpan di database
-                - session_urls: Jumlah URL dalam session cache
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM tweet_hashes")
-            total_stored = cursor.fetchone()[0]
-            conn.close()
+            with self._lock:
+                self._flush_pending()
+                total_stored = self._conn.execute(self._SQL_COUNT).fetchone()[0]
 
             return {
-                'session_count': len(self.session_hashes),
-                'total_stored': total_stored,
-                'session_urls': len(self.session_urls)
+                'session_count': len(self.session_url_hashes),
+                'total_stored': total_stored
             }
         except Exception as e:
             print(f"Error getting stats: {e}")
-            return {'session_count': 0, 'total_stored': 0, 'session_urls': 0}
+            return {'session_count': 0, 'total_stored': 0}
 
     def clear_session(self):
         """
         Clear session-level cache (in-memory).
 
-        Menghapus semua data dari session_hashes dan session_urls.
+        Menghapus semua data dari session_url_hashes.
         Database tidak terpengaruh.
         """
-        self.session_hashes.clear()
-        self.session_urls.clear()
+        self.session_url_hashes.clear()
 
     def cleanup_old_entries(self, days: int = 30):
         """
@@ -306,16 +574,18 @@ class AdvancedDeduplicator:
             >>> print(f"Deleted {deleted} old entries")
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('''
-                DELETE FROM tweet_hashes
-                WHERE created_at < datetime('now', '-{} days')
-            '''.format(days))
-            deleted = cursor.rowcount
-            conn.commit()
-            conn.close()
-            return deleted
+            with self._lock:
+                self._flush_pending()
+                modifier = f'-{int(days)} days'
+                # Kunci tulis diambil di awal agar DELETE tidak gagal saat upgrade lock
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor = self._conn.execute(self._SQL_CLEANUP, (modifier,))
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                return cursor.rowcount
         except Exception as e:
             print(f"Error cleaning up old entries: {e}")
             return 0
@@ -3,7 +3,15 @@ Progress tracking system with time estimation and performance statistics.
 """
 
 import time
-from typing import Dict, Any
+from collections import deque
+from typing import Dict, Any, Optional
+
+from ..config.constants import SESSION_HISTORY_SIZE
+
+_NS_PER_MINUTE = 60_000_000_000
+_SPEED_UNIT = " tweet/menit"
+_ETA_CALCULATING = "Menghitung..."
+_ETA_DONE = "Selesai"
 
 
 class ProgressTracker:
@@ -17,16 +25,25 @@ class ProgressTracker:
     - Statistik performa (best speed, avg time, dll)
 
     Attributes:
-        start_time (float): Waktu mulai scraping keseluruhan
-        session_start_time (float): Waktu mulai sesi saat ini
+        start_time (int): Waktu mulai scraping keseluruhan (nanodetik)
+        session_start_time (int): Waktu mulai sesi saat ini (nanodetik)
         total_target (int): Target total tweet untuk semua sesi
         current_count (int): Jumlah tweet terkumpul saat ini
         session_target (int): Target tweet untuk sesi saat ini
         session_count (int): Jumlah tweet terkumpul di sesi ini
         session_number (int): Nomor sesi saat ini
         total_sessions (int): Total jumlah sesi
-        tweets_per_minute_history (List[float]): History kecepatan per sesi
-        session_times (List[float]): History durasi per sesi
+        session_times (deque): History durasi sesi terakhir
+
+    History durasi dibatasi SESSION_HISTORY_SIZE sesi (ring buffer). Jumlah
+    durasi dan kecepatan terbaik di-maintain secara incremental sehingga
+    statistik tidak perlu scan history.
+
+    Note:
+        Waktu diukur dengan time.monotonic_ns() sehingga tidak terpengaruh
+        perubahan jam sistem. get_statistics() membaca jam sekali dan
+        meneruskannya ke helper kecepatan/ETA. Dict hasilnya dipakai ulang
+        selama counter (versi) dan kecepatan (presisi 0.1) tidak berubah.
     """
 
     def __init__(self):
@@ -43,8 +60,12 @@ class ProgressTracker:
         self.session_count = 0
         self.session_number = 0
         self.total_sessions = 0
-        self.tweets_per_minute_history = []
-        self.session_times = []
+        self.session_times = deque(maxlen=SESSION_HISTORY_SIZE)
+        self._session_time_sum = 0.0
+        self._best_speed = None
+        self._version = 0
+        self._stats_cache = None
+        self._stats_cache_key = None
 
     def start_scraping(self, total_target: int, total_sessions: int):
         """
@@ -57,13 +78,15 @@ class ProgressTracker:
         Note:
             Method ini harus dipanggil sebelum mulai scraping.
         """
-        self.start_time = time.time()
+        self.start_time = time.monotonic_ns()
         self.total_target = total_target
         self.total_sessions = total_sessions
         self.current_count = 0
         self.session_number = 0
-        self.tweets_per_minute_history.clear()
         self.session_times.clear()
+        self._session_time_sum = 0.0
+        self._best_speed = None
+        self._version += 1
 
     def start_session(self, session_target: int):
         """
@@ -75,10 +98,11 @@ class ProgressTracker:
         Note:
             Session number akan otomatis increment.
         """
-        self.session_start_time = time.time()
+        self.session_start_time = time.monotonic_ns()
         self.session_target = session_target
         self.session_count = 0
         self.session_number += 1
+        self._version += 1
 
     def update_progress(self, current_session_count: int, total_count: int):
         """
@@ -88,8 +112,10 @@ class ProgressTracker:
             current_session_count (int): Jumlah tweet di sesi ini
             total_count (int): Total tweet terkumpul keseluruhan
         """
-        self.session_count = current_session_count
-        self.current_count = total_count
+        if current_session_count != self.session_count or total_count != self.current_count:
+            self.session_count = current_session_count
+            self.current_count = total_count
+            self._version += 1
 
     def get_current_speed(self) -> float:
         """
@@ -98,14 +124,7 @@ class ProgressTracker:
         Returns:
             float: Tweets per minute, atau 0.0 jika belum ada data
         """
-        if not self.session_start_time:
-            return 0.0
-
-        elapsed_minutes = (time.time() - self.session_start_time) / 60
-        if elapsed_minutes == 0:
-            return 0.0
-
-        return self.session_count / elapsed_minutes
+        return self._current_speed(time.monotonic_ns())
 
     def get_average_speed(self) -> float:
         """
@@ -114,14 +133,23 @@ class ProgressTracker:
         Returns:
             float: Average tweets per minute, atau 0.0 jika belum ada data
         """
-        if not self.start_time:
-            return 0.0
+        return self._average_speed(time.monotonic_ns())
 
-        elapsed_minutes = (time.time() - self.start_time) / 60
-        if elapsed_minutes == 0:
+    @staticmethod
+    def _get_speed(now_ns: int, start_ns, count: int) -> float:
+        """Tweets per minute dari count sejak start_ns; 0.0 jika belum mulai."""
+        if not start_ns:
             return 0.0
+        elapsed_ns = now_ns - start_ns
+        if elapsed_ns <= 0:
+            return 0.0
+        return count * _NS_PER_MINUTE / elapsed_ns
+
+    def _current_speed(self, now_ns: int) -> float:
+        return self._get_speed(now_ns, self.session_start_time, self.session_count)
 
-        return self.current_count / elapsed_minutes
+    def _average_speed(self, now_ns: int) -> float:
+        return self._get_speed(now_ns, self.start_time, self.current_count)
 
     def get_session_eta(self) -> str:
         """
@@ -131,16 +159,7 @@ class ProgressTracker:
             str: ETA dalam format readable (e.g., "5m 30d", "2j 15m")
                  atau "Menghitung..." jika belum bisa dihitung
         """
-        current_speed = self.get_current_speed()
-        if current_speed == 0:
-            return "Menghitung..."
-
-        remaining_tweets = self.session_target - self.session_count
-        if remaining_tweets <= 0:
-            return "Selesai"
-
-        eta_minutes = remaining_tweets / current_speed
-        return self.format_time(eta_minutes * 60)
+        return self._session_eta(self.get_current_speed())
 
     def get_total_eta(self) -> str:
         """
@@ -149,31 +168,49 @@ class ProgressTracker:
         Returns:
             str: ETA dalam format readable atau "Menghitung..."
         """
-        avg_speed = self.get_average_speed()
-        if avg_speed == 0:
-            return "Menghitung..."
+        return self._total_eta(self.get_average_speed())
 
-        remaining_tweets = self.total_target - self.current_count
+    @staticmethod
+    def _eta_seconds(remaining_tweets: int, speed: float) -> Optional[float]:
+        """ETA dalam detik; None jika belum bisa dihitung, 0.0 jika sudah selesai."""
+        if speed == 0:
+            return None
         if remaining_tweets <= 0:
-            return "Selesai"
+            return 0.0
+        return remaining_tweets / speed * 60
+
+    def _format_eta(self, eta_seconds: Optional[float]) -> str:
+        if eta_seconds is None:
+            return _ETA_CALCULATING
+        if eta_seconds <= 0:
+            return _ETA_DONE
+        return self.format_time(eta_seconds)
 
-        eta_minutes = remaining_tweets / avg_speed
-        return self.format_time(eta_minutes * 60)
+    def _session_eta(self, current_speed: float) -> str:
+        return self._format_eta(self._eta_seconds(self.session_target - self.session_count, current_speed))
+
+    def _total_eta(self, avg_speed: float) -> str:
+        return self._format_eta(self._eta_seconds(self.total_target - self.current_count, avg_speed))
 
     def finish_session(self):
         """
         Mark sesi saat ini sebagai selesai dan record statistiknya.
 
-        Menyimpan durasi sesi dan kecepatan ke history untuk
-        perhitungan statistik.
+        Menyimpan durasi sesi ke history dan memperbarui kecepatan
+        terbaik untuk perhitungan statistik.
         """
         if self.session_start_time:
-            session_duration = time.time() - self.session_start_time
+            session_duration = (time.monotonic_ns() - self.session_start_time) / 1e9
+            if len(self.session_times) == self.session_times.maxlen:
+                self._session_time_sum -= self.session_times[0]
             self.session_times.append(session_duration)
+            self._session_time_sum += session_duration
+            self._version += 1
 
             if session_duration > 0:
                 session_speed = self.session_count / (session_duration / 60)
-                self.tweets_per_minute_history.append(session_speed)
+                if self._best_speed is None or session_speed > self._best_speed:
+                    self._best_speed = session_speed
 
     def get_progress_percentage(self) -> float:
         """
@@ -210,21 +247,60 @@ class ProgressTracker:
                 - < 3600s: "5m 30d"
                 - >= 3600s: "2j 15m"
         """
+        seconds = int(seconds)
         if seconds < 60:
-            return f"{int(seconds)}d"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            secs = int(seconds % 60)
+            return f"{seconds}d"
+        minutes, secs = divmod(seconds, 60)
+        if minutes < 60:
             return f"{minutes}m {secs}d"
-        else:
-            hours = int(seconds / 3600)
-            minutes = int((seconds % 3600) / 60)
-            return f"{hours}j {minutes}m"
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}j {minutes}m"
+
+    def get_raw_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistik progress dalam bentuk numerik (tanpa formatting).
+
+        Cocok untuk consumer selain GUI, misalnya menulis statistik ke
+        CSV/JSON.
+
+        Returns:
+            Dict[str, Any]: Dictionary berisi:
+                - current_speed, average_speed: Tweets per minute (float)
+                - session_progress, total_progress: Progress 0-100 (float)
+                - session_eta, total_eta: Sisa waktu dalam detik, 0.0 jika
+                  selesai, None jika belum bisa dihitung
+                - session_number, total_sessions: Nomor sesi & total sesi
+                - current_count, total_target: Tweet terkumpul & target
+                - avg_session_time: Rata-rata durasi sesi dalam detik (None jika belum ada)
+                - best_speed: Kecepatan sesi terbaik (None jika belum ada)
+        """
+        now = time.monotonic_ns()
+        current_speed = self._current_speed(now)
+        avg_speed = self._average_speed(now)
+        return {
+            'current_speed': current_speed,
+            'average_speed': avg_speed,
+            'session_progress': self.get_session_percentage(),
+            'total_progress': self.get_progress_percentage(),
+            'session_eta': self._eta_seconds(self.session_target - self.session_count, current_speed),
+            'total_eta': self._eta_seconds(self.total_target - self.current_count, avg_speed),
+            'session_number': self.session_number,
+            'total_sessions': self.total_sessions,
+            'current_count': self.current_count,
+            'total_target': self.total_target,
+            'avg_session_time': (
+                self._session_time_sum / len(self.session_times) if self.session_times else None
+            ),
+            'best_speed': self._best_speed
+        }
 
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive statistics tentang progress scraping.
 
+        Versi terformat dari get_raw_statistics(). Dict hasil format
+        dipakai ulang selama counter (versi) dan kecepatan tidak berubah.
+
         Returns:
             Dict[str, Any]: Dictionary berisi:
                 - current_speed: Kecepatan saat ini
@@ -243,26 +319,31 @@ class ProgressTracker:
             >>> print(stats['current_speed'])  # "45.2 tweet/menit"
             >>> print(stats['total_eta'])  # "15m 30d"
         """
-        current_speed = self.get_current_speed()
-        avg_speed = self.get_average_speed()
+        raw = self.get_raw_statistics()
+        current_speed = raw['current_speed']
+        avg_speed = raw['average_speed']
+
+        cache_key = (int(current_speed * 10), int(avg_speed * 10), self._version)
+        if self._stats_cache is not None and cache_key == self._stats_cache_key:
+            return self._stats_cache
 
         stats = {
-            'current_speed': f"{current_speed:.1f} tweet/menit",
-            'average_speed': f"{avg_speed:.1f} tweet/menit",
-            'session_progress': f"{self.get_session_percentage():.1f}%",
-            'total_progress': f"{self.get_progress_percentage():.1f}%",
-            'session_eta': self.get_session_eta(),
-            'total_eta': self.get_total_eta(),
+            'current_speed': f"{current_speed:.1f}{_SPEED_UNIT}",
+            'average_speed': f"{avg_speed:.1f}{_SPEED_UNIT}",
+            'session_progress': f"{raw['session_progress']:.1f}%",
+            'total_progress': f"{raw['total_progress']:.1f}%",
+            'session_eta': self._format_eta(raw['session_eta']),
+            'total_eta': self._format_eta(raw['total_eta']),
             'session_number': f"{self.session_number}/{self.total_sessions}",
             'tweets_collected': f"{self.current_count}/{self.total_target}"
         }
 
-        if self.session_times:
-            avg_session_time = sum(self.session_times) / len(self.session_times)
-            stats['avg_session_time'] = self.format_time(avg_session_time)
+        if raw['avg_session_time'] is not None:
+            stats['avg_session_time'] = self.format_time(raw['avg_session_time'])
 
-        if self.tweets_per_minute_history:
-            best_speed = max(self.tweets_per_minute_history)
-            stats['best_speed'] = f"{best_speed:.1f} tweet/menit"
+        if raw['best_speed'] is not None:
+            stats['best_speed'] = f"{raw['best_speed']:.1f}{_SPEED_UNIT}"
 
+        self._stats_cache = stats
+        self._stats_cache_key = cache_key
         return stats
@@ -12,6 +12,17 @@ LIGHT_THEME = """
         font-weight: bold;
         color: #333333;
     }
+    QLabel#titleLabel {
+        font-size: 18px;
+        margin-bottom: 10px;
+    }
+    QLabel[statPill="true"] {
+        font-size: 11px;
+        padding: 5px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        background-color: #f9f9f9;
+    }
     QPushButton#startBtn {
         background-color: #4CAF50;
         color: white;
@@ -51,7 +62,7 @@ LIGHT_THEME = """
     QPushButton#themeBtn:hover {
         background-color: #1976D2;
     }
-    QTextEdit, QTableWidget {
+    QTextEdit, QPlainTextEdit, QTableWidget, QTableView {
         background-color: #f9f9f9;
         border: 1px solid #ddd;
         border-radius: 5px;
@@ -120,6 +131,17 @@ DARK_THEME = """
         font-weight: bold;
         color: #ffffff;
     }
+    QLabel#titleLabel {
+        font-size: 18px;
+        margin-bottom: 10px;
+    }
+    QLabel[statPill="true"] {
+        font-size: 11px;
+        padding: 5px;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        background-color: #3c3c3c;
+    }
     QPushButton#startBtn {
         background-color: #4CAF50;
         color: white;
@@ -159,7 +181,7 @@ DARK_THEME = """
     QPushButton#themeBtn:hover {
         background-color: #F57C00;
     }
-    QTextEdit, QTableWidget {
+    QTextEdit, QPlainTextEdit, QTableWidget, QTableView {
         background-color: #3c3c3c;
         border: 1px solid #555;
         border-radius: 5px;
@@ -2,24 +2,39 @@
 Theme management system with persistent storage.
 """
 
-from PyQt5.QtCore import QSettings
+from functools import lru_cache
 
+from PyQt5.QtCore import QCoreApplication, QSettings, QTimer
+
+from ..config.constants import THEME_SAVE_DELAY_MS
 from .styles.themes import LIGHT_THEME, DARK_THEME
 
 
+_THEME_STYLES = {"light": LIGHT_THEME, "dark": DARK_THEME}
+_THEME_BUTTON_TEXTS = {"light": "🌙 Mode Gelap", "dark": "☀️ Mode Terang"}
+
+
 class ThemeManager:
     """Sistem manajemen tema dark/light dengan persistent storage"""
 
     def __init__(self):
         self.settings = QSettings("TweetScraper", "Themes")
+        self.settings.setFallbacksEnabled(False)
         self.current_theme = self.settings.value("theme", "light", type=str)
 
+        # Penulisan ke disk di-debounce; toggle beruntun hanya menulis sekali
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(THEME_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save_theme)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.save_theme)
+
     def get_current_theme_style(self) -> str:
         """Get current theme stylesheet"""
-        if self.current_theme == "dark":
-            return DARK_THEME
-        else:
-            return LIGHT_THEME
+        return _THEME_STYLES.get(self.current_theme, LIGHT_THEME)
 
     def toggle_theme(self) -> str:
         """Toggle between light and dark theme"""
@@ -28,13 +43,27 @@ class ThemeManager:
         else:
             self.current_theme = "light"
 
-        # Save to settings
-        self.settings.setValue("theme", self.current_theme)
+        # Save to settings (tertunda)
+        self._save_timer.start()
         return self.current_theme
 
+    def save_theme(self):
+        """Tulis tema saat ini ke QSettings dan flush ke disk"""
+        self._save_timer.stop()
+        self.settings.setValue("theme", self.current_theme)
+        self.settings.sync()
+
     def get_theme_button_text(self) -> str:
         """Get appropriate button text for current theme"""
-        if self.current_theme == "light":
-            return "🌙 Mode Gelap"
-        else:
-            return "☀️ Mode Terang"
+        return _THEME_BUTTON_TEXTS.get(self.current_theme, _THEME_BUTTON_TEXTS["dark"])
+
+
+@lru_cache(maxsize=1)
+def get_theme_manager() -> ThemeManager:
+    """
+    ThemeManager bersama untuk seluruh aplikasi.
+
+    QSettings tema hanya dibuka sekali, dan semua komponen melihat
+    tema yang sama.
+    """
+    return ThemeManager()
@@ -4,5 +4,6 @@ from .signals import LoggerSignals
 from .main_window_v2 import TweetScraperGUIV2
 from .analytics_dashboard import AnalyticsDashboard
 from .threading_config import MultiThreadingConfig
+from .tweet_table_model import TweetTableModel
 
-__all__ = ['LoggerSignals', 'TweetScraperGUIV2', 'AnalyticsDashboard', 'MultiThreadingConfig']
+__all__ = ['LoggerSignals', 'TweetScraperGUIV2', 'AnalyticsDashboard', 'MultiThreadingConfig', 'TweetTableModel']
@@ -2,7 +2,9 @@
 Dashboard Visualisasi untuk analisis tweet.
 """
 
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
@@ -11,14 +13,80 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
-try:
-    import matplotlib
-    matplotlib.use('Qt5Agg')
-    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
-    from matplotlib.figure import Figure
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# matplotlib dan pyqtgraph (keduanya optional) baru di-import saat chart
+# pertama digambar, sehingga startup GUI tidak menanggung biayanya jika
+# dashboard tidak pernah dipakai.
+
+
+@lru_cache(maxsize=1)
+def _get_mpl() -> Optional[Tuple[type, type]]:
+    """
+    Import matplotlib (backend Qt5Agg) sekali.
+
+    Returns:
+        Optional[Tuple[type, type]]: (Figure, FigureCanvasQTAgg), atau None
+            jika matplotlib tidak terinstall
+    """
+    try:
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure
+    except ImportError:
+        return None
+    return Figure, FigureCanvasQTAgg
+
+
+@lru_cache(maxsize=1)
+def _get_pg():
+    """
+    Import pyqtgraph sekali.
+
+    pyqtgraph dipakai untuk bar chart: digambar langsung via QPainter
+    tanpa render Agg ke QImage. Fallback ke matplotlib jika tidak ada.
+
+    Returns:
+        module: Modul pyqtgraph, atau None jika tidak terinstall
+    """
+    try:
+        import pyqtgraph
+    except ImportError:
+        return None
+    return pyqtgraph
+
+
+# Urutan sama dengan _sentiment_counts(): positif, negatif, netral
+_SENTIMENT_LABELS = ('Positif', 'Negatif', 'Netral')
+_SENTIMENT_COLORS = ('#4CAF50', '#f44336', '#FF9800')
+
+# Jumlah item maksimum per bar chart
+_TOP_HASHTAGS_SHOWN = 15
+_TOP_KEYWORDS_SHOWN = 20
+
+# Stat card: judul kecil + nilai besar dalam satu QLabel
+_STAT_CARD_HTML = (
+    "<span style='font-family: Arial; font-size: 10pt;'>%s</span><br>"
+    "<span style='font-family: Arial; font-size: 16pt; font-weight: bold;'>%s</span>"
+)
+_STAT_CARD_STYLE = """
+    QLabel {
+        background-color: %s;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 15px;
+    }
+"""
+
+
+def matplotlib_available() -> bool:
+    """Cek apakah matplotlib terinstall (memicu import pertama kali)."""
+    return _get_mpl() is not None
+
+
+def pyqtgraph_available() -> bool:
+    """Cek apakah pyqtgraph terinstall (memicu import pertama kali)."""
+    return _get_pg() is not None
 
 
 class AnalyticsDashboard(QWidget):
@@ -38,6 +106,10 @@ class AnalyticsDashboard(QWidget):
         self.df = None
         self.sentiment_data = None
         self.trend_data = None
+        # Chart persisten per key: (QGroupBox, canvas/PlotWidget), dipakai ulang antar refresh
+        self._charts: Dict[str, Tuple[QGroupBox, QWidget]] = {}
+        # (sentiment_data, (positif, negatif, netral)) dari ekstraksi terakhir
+        self._sentiment_cache: Optional[Tuple[Dict, Tuple[int, int, int]]] = None
         self.init_ui()
 
     def init_ui(self):
@@ -53,13 +125,11 @@ class AnalyticsDashboard(QWidget):
         layout.addWidget(header)
 
         # Scroll area untuk charts
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_content = QWidget()
-        self.charts_layout = QVBoxLayout(scroll_content)
-        scroll.setWidget(scroll_content)
+        self._scroll = QScrollArea()
+        self._scroll.setWidgetResizable(True)
+        self._new_charts_container()
 
-        layout.addWidget(scroll)
+        layout.addWidget(self._scroll)
 
         # Info label
         self.info_label = QLabel("Belum ada data. Silakan load data dari file atau scraping terlebih dahulu.")
@@ -69,6 +139,12 @@ class AnalyticsDashboard(QWidget):
 
         self.setLayout(layout)
 
+    def _new_charts_container(self):
+        """Buat container + charts_layout baru dan pasang di scroll area."""
+        self._charts_container = QWidget()
+        self.charts_layout = QVBoxLayout(self._charts_container)
+        self._scroll.setWidget(self._charts_container)
+
     def load_data(self, df: pd.DataFrame, sentiment_data: Dict = None, trend_data: Dict = None):
         """
         Load data untuk visualisasi.
@@ -85,11 +161,16 @@ class AnalyticsDashboard(QWidget):
 
     def update_dashboard(self):
         """Update semua visualisasi di dashboard."""
-        # Clear existing widgets
-        while self.charts_layout.count():
-            child = self.charts_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        # Chart persisten dilepas dulu agar tidak ikut terhapus bersama container lama
+        for chart_group, _ in self._charts.values():
+            chart_group.hide()
+            chart_group.setParent(None)
+
+        # Ganti container sekaligus: satu deleteLater menghapus semua widget lama
+        old_container = self._scroll.takeWidget()
+        self._new_charts_container()
+        if old_container is not None:
+            old_container.deleteLater()
 
         if self.df is None or len(self.df) == 0:
             self.info_label = QLabel("Tidak ada data untuk ditampilkan.")
@@ -101,7 +182,7 @@ class AnalyticsDashboard(QWidget):
         self.add_summary_stats()
 
         # Charts
-        if MATPLOTLIB_AVAILABLE:
+        if matplotlib_available() or pyqtgraph_available():
             if self.sentiment_data:
                 self.add_sentiment_chart()
 
@@ -124,19 +205,21 @@ class AnalyticsDashboard(QWidget):
 
         # Sentiment stats
         if self.sentiment_data:
+            positif_count, negatif_count, netral_count = self._sentiment_counts()
+            get = self.sentiment_data.get
             positif = self.create_stat_card(
                 "Positif",
-                f"{self.sentiment_data.get('positif_count', 0)} ({self.sentiment_data.get('positif_percentage', 0)}%)",
+                f"{positif_count} ({get('positif_percentage', 0)}%)",
                 "#2196F3"
             )
             negatif = self.create_stat_card(
                 "Negatif",
-                f"{self.sentiment_data.get('negatif_count', 0)} ({self.sentiment_data.get('negatif_percentage', 0)}%)",
+                f"{negatif_count} ({get('negatif_percentage', 0)}%)",
                 "#f44336"
             )
             netral = self.create_stat_card(
                 "Netral",
-                f"{self.sentiment_data.get('netral_count', 0)} ({self.sentiment_data.get('netral_percentage', 0)}%)",
+                f"{netral_count} ({get('netral_percentage', 0)}%)",
                 "#FF9800"
             )
 
@@ -147,61 +230,49 @@ class AnalyticsDashboard(QWidget):
         stats_group.setLayout(stats_layout)
         self.charts_layout.addWidget(stats_group)
 
-    def create_stat_card(self, title: str, value: str, color: str) -> QWidget:
-        """Create a stat card widget."""
-        card = QWidget()
-        card.setStyleSheet(f"""
-            QWidget {{
-                background-color: {color};
-                border-radius: 8px;
-                padding: 15px;
-            }}
-            QLabel {{
-                color: white;
-                border: none;
-            }}
-        """)
-
-        layout = QVBoxLayout()
-        title_label = QLabel(title)
-        title_label.setFont(QFont("Arial", 10))
-        value_label = QLabel(value)
-        value_label.setFont(QFont("Arial", 16, QFont.Bold))
+    def _sentiment_counts(self) -> Tuple[int, int, int]:
+        """
+        Jumlah tweet (positif, negatif, netral) dari sentiment_data.
 
-        layout.addWidget(title_label)
-        layout.addWidget(value_label)
-        card.setLayout(layout)
+        Hasil di-cache per objek sentiment_data sehingga summary cards dan
+        pie chart berbagi satu ekstraksi per refresh.
+        """
+        data = self.sentiment_data
+        if self._sentiment_cache is None or self._sentiment_cache[0] is not data:
+            counts = (
+                data.get('positif_count', 0),
+                data.get('negatif_count', 0),
+                data.get('netral_count', 0)
+            )
+            self._sentiment_cache = (data, counts)
+        return self._sentiment_cache[1]
 
+    def create_stat_card(self, title: str, value: str, color: str) -> QWidget:
+        """Create a stat card widget (satu QLabel rich text)."""
+        card = QLabel(_STAT_CARD_HTML % (title, value))
+        card.setTextFormat(Qt.RichText)
+        card.setStyleSheet(_STAT_CARD_STYLE % color)
         return card
 
     def add_sentiment_chart(self):
         """Tambahkan pie chart sentiment distribution."""
-        if not MATPLOTLIB_AVAILABLE:
+        if not matplotlib_available():
             return
 
-        chart_group = QGroupBox("🎭 Sentiment Distribution")
-        layout = QVBoxLayout()
-
-        # Figure size yang cukup
-        fig = Figure(figsize=(8, 4), dpi=80)
-        canvas = FigureCanvasQTAgg(fig)
+        canvas = self._show_chart('sentiment', "🎭 Sentiment Distribution", use_pyqtgraph=False)
 
         # Set minimum height agar tidak gepeng/error saat render
         canvas.setMinimumHeight(400)
 
-        ax = fig.add_subplot(111)
+        fig = canvas.figure
+        ax = fig.axes[0]
+        ax.clear()
 
-        labels = ['Positif', 'Negatif', 'Netral']
-        sizes = [
-            self.sentiment_data.get('positif_count', 0),
-            self.sentiment_data.get('negatif_count', 0),
-            self.sentiment_data.get('netral_count', 0)
-        ]
-        colors = ['#4CAF50', '#f44336', '#FF9800']
+        sizes = self._sentiment_counts()
 
         # Cek apakah ada data
         if sum(sizes) > 0:
-            ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
+            ax.pie(sizes, labels=_SENTIMENT_LABELS, colors=_SENTIMENT_COLORS, autopct='%1.1f%%', startangle=90)
             ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
         else:
             ax.text(0.5, 0.5, "Tidak ada data sentimen", ha='center', va='center')
@@ -209,97 +280,134 @@ class AnalyticsDashboard(QWidget):
         ax.set_title('Sentiment Distribution', fontsize=11, pad=10)
 
         fig.tight_layout()
-
-        layout.addWidget(canvas)
-        chart_group.setLayout(layout)
-        self.charts_layout.addWidget(chart_group)
+        canvas.draw_idle()
 
     def add_hashtags_chart(self):
         """Tambahkan bar chart top hashtags."""
-        if not MATPLOTLIB_AVAILABLE or not self.trend_data:
+        if not self.trend_data:
             return
 
-        top_hashtags = self.trend_data.get('top_hashtags', [])
-        if not top_hashtags:
+        top_hashtags = self.trend_data.get('top_hashtags')
+        if top_hashtags is None or top_hashtags.empty:
             return
 
-        chart_group = QGroupBox("🏷️ Top Hashtags")
-        layout = QVBoxLayout()
-
-        # Hitung tinggi dinamis berdasarkan jumlah item
-        # Base height 1.5 inch + 0.4 inch per item
-        num_items = len(top_hashtags[:15])  # Tampilkan sampai 15 hashtag
-        fig_height = 1.5 + (num_items * 0.4)
-
-        # Buat figure dengan tinggi dinamis
-        fig = Figure(figsize=(8, fig_height), dpi=80)
-        canvas = FigureCanvasQTAgg(fig)
-
-        # Set minimum height agar scroll area bekerja
-        canvas.setMinimumHeight(int(fig_height * 80))
-
-        ax = fig.add_subplot(111)
-
-        # Ambil data
-        hashtags = [f"#{tag}" for tag, _ in top_hashtags[:15]]
-        counts = [count for _, count in top_hashtags[:15]]
-
-        # Plot horizontal bar
-        ax.barh(hashtags, counts, color='#2196F3', height=0.6)
-        ax.set_xlabel('Count', fontsize=10)
-        ax.set_title(f'Top {num_items} Hashtags', fontsize=11, pad=10)
-        ax.tick_params(axis='both', labelsize=9)
-        ax.invert_yaxis()  # Terbanyak di atas
-        ax.grid(axis='x', alpha=0.3, linestyle='--')
-
-        # Adjust layout agar label tidak terpotong
-        fig.tight_layout()
-
-        layout.addWidget(canvas)
-        chart_group.setLayout(layout)
-        self.charts_layout.addWidget(chart_group)
+        top_hashtags = top_hashtags.head(_TOP_HASHTAGS_SHOWN)
+        self._add_bar_chart(
+            'hashtags',
+            "🏷️ Top Hashtags",
+            f'Top {len(top_hashtags)} Hashtags',
+            ['#' + tag for tag in top_hashtags.index],
+            top_hashtags.to_numpy(),
+            '#2196F3'
+        )
 
     def add_keywords_chart(self):
         """Tambahkan bar chart top keywords."""
-        if not MATPLOTLIB_AVAILABLE or not self.trend_data:
+        if not self.trend_data:
             return
 
-        top_keywords = self.trend_data.get('top_keywords', [])
-        if not top_keywords:
+        top_keywords = self.trend_data.get('top_keywords')
+        if top_keywords is None or top_keywords.empty:
             return
 
-        chart_group = QGroupBox("🔑 Top Keywords")
-        layout = QVBoxLayout()
+        top_keywords = top_keywords.head(_TOP_KEYWORDS_SHOWN)
+        self._add_bar_chart(
+            'keywords',
+            "🔑 Top Keywords",
+            f'Top {len(top_keywords)} Keywords',
+            top_keywords.index.tolist(),
+            top_keywords.to_numpy(),
+            '#4CAF50'
+        )
+
+    def _add_bar_chart(self, key: str, group_title: str, plot_title: str,
+                       labels: List[str], counts: np.ndarray, color: str):
+        """
+        Tambahkan horizontal bar chart (terbanyak di atas) ke dashboard.
 
-        # Hitung tinggi dinamis berdasarkan jumlah item
-        # Base height 1.5 inch + 0.4 inch per item
-        num_items = len(top_keywords[:20])  # Tampilkan sampai 20 keyword
-        fig_height = 1.5 + (num_items * 0.4)
+        Memakai pyqtgraph jika tersedia, selain itu matplotlib.
 
-        # Buat figure dengan tinggi dinamis
-        fig = Figure(figsize=(8, fig_height), dpi=80)
-        canvas = FigureCanvasQTAgg(fig)
+        Args:
+            key (str): Identitas chart persisten
+            group_title (str): Judul QGroupBox
+            plot_title (str): Judul chart
+            labels (List[str]): Label tiap bar
+            counts (np.ndarray): Nilai tiap bar (int64)
+            color (str): Warna bar
+        """
+        pg = _get_pg()
+        if pg is None and not matplotlib_available():
+            return
 
-        # Set minimum height agar scroll area bekerja
-        canvas.setMinimumHeight(int(fig_height * 80))
+        chart = self._show_chart(key, group_title, use_pyqtgraph=pg is not None)
 
-        ax = fig.add_subplot(111)
+        # Hitung tinggi dinamis berdasarkan jumlah item
+        # Base height 1.5 inch + 0.4 inch per item (80 dpi)
+        fig_height = 1.5 + (len(labels) * 0.4)
+
+        if pg is not None:
+            chart.clear()
+            chart.setTitle(plot_title)
+            chart.getAxis('left').setTicks([list(enumerate(labels))])
+            chart.addItem(pg.BarGraphItem(
+                x0=0, y=list(range(len(labels))), width=counts, height=0.6, brush=color
+            ))
+        else:
+            fig = chart.figure
+            fig.set_size_inches(8, fig_height)
+            ax = fig.axes[0]
+            ax.clear()
+
+            ax.barh(labels, counts, color=color, height=0.6)
+            ax.set_xlabel('Count', fontsize=10)
+            ax.set_title(plot_title, fontsize=11, pad=10)
+            ax.tick_params(axis='both', labelsize=9)
+            ax.invert_yaxis()  # Terbanyak di atas
+            ax.grid(axis='x', alpha=0.3, linestyle='--')
+
+            # Adjust layout agar label tidak terpotong
+            fig.tight_layout()
+            chart.draw_idle()
 
-        # Ambil data
-        keywords = [kw for kw, _ in top_keywords[:20]]
-        counts = [count for _, count in top_keywords[:20]]
+        # Set minimum height agar scroll area bekerja
+        chart.setMinimumHeight(int(fig_height * 80))
 
-        # Plot horizontal bar
-        ax.barh(keywords, counts, color='#4CAF50', height=0.6)
-        ax.set_xlabel('Count', fontsize=10)
-        ax.set_title(f'Top {num_items} Keywords', fontsize=11, pad=10)
-        ax.tick_params(axis='both', labelsize=9)
-        ax.invert_yaxis()  # Terbanyak di atas
-        ax.grid(axis='x', alpha=0.3, linestyle='--')
+    def _show_chart(self, key: str, group_title: str, use_pyqtgraph: bool) -> QWidget:
+        """
+        Tampilkan chart persisten untuk key dan kembalikan widget chart-nya.
 
-        # Adjust layout agar label tidak terpotong
-        fig.tight_layout()
+        Group box dan Figure/FigureCanvasQTAgg (atau PlotWidget) dibuat
+        sekali saat pertama kali dipakai; refresh berikutnya hanya
+        menggambar ulang isinya.
 
-        layout.addWidget(canvas)
-        chart_group.setLayout(layout)
+        Args:
+            key (str): Identitas chart
+            group_title (str): Judul QGroupBox
+            use_pyqtgraph (bool): Buat PlotWidget pyqtgraph alih-alih canvas matplotlib
+
+        Returns:
+            QWidget: FigureCanvasQTAgg (dengan satu axes) atau pg.PlotWidget
+        """
+        if key not in self._charts:
+            chart_group = QGroupBox(group_title)
+            layout = QVBoxLayout()
+
+            if use_pyqtgraph:
+                chart = _get_pg().PlotWidget(background='w')
+                chart.setLabel('bottom', 'Count')
+                chart.showGrid(x=True, alpha=0.3)
+                chart.setMouseEnabled(x=False, y=False)
+                chart.invertY(True)  # Terbanyak di atas
+            else:
+                Figure, FigureCanvasQTAgg = _get_mpl()
+                chart = FigureCanvasQTAgg(Figure(figsize=(8, 4), dpi=80))
+                chart.figure.add_subplot(111)
+
+            layout.addWidget(chart)
+            chart_group.setLayout(layout)
+            self._charts[key] = (chart_group, chart)
+
+        chart_group, chart = self._charts[key]
         self.charts_layout.addWidget(chart_group)
+        chart_group.show()
+        return chart
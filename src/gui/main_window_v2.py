@@ -1,26 +1,63 @@
 import os
-from typing import Dict, Any
+from collections import deque
+from typing import Dict, Any, List
 from threading import Thread, Event
 from datetime import timedelta
 
 import pandas as pd
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QDateEdit, QComboBox,
-    QPushButton, QTextEdit, QSpinBox, QGridLayout, QGroupBox,
-    QTabWidget, QTableWidget, QTableWidgetItem, QProgressBar,
+    QPushButton, QPlainTextEdit, QSpinBox, QGridLayout, QGroupBox,
+    QTabWidget, QTableView, QProgressBar,
     QHBoxLayout, QCheckBox, QFrame, QSplitter, QStackedWidget,
     QFileDialog, QMessageBox, QScrollArea, QSystemTrayIcon, QStyle
 )
-from PyQt5.QtCore import QDate, Qt
+from PyQt5.QtCore import QDate, Qt, QTimer
 from PyQt5.QtGui import QFont
 import winsound
 
-from ..config.constants import WINDOW_WIDTH, WINDOW_HEIGHT, MIN_LEFT_PANEL_WIDTH, MAX_LEFT_PANEL_WIDTH
-from ..core import ThemeManager
-from ..scraper import main_scraping_function
+from ..config.constants import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, MIN_LEFT_PANEL_WIDTH, MAX_LEFT_PANEL_WIDTH,
+    STATS_REFRESH_INTERVAL_MS, LOG_FLUSH_INTERVAL_MS, LOG_BUFFER_SIZE, LOG_MAX_BLOCKS,
+    TWEET_FIELDS
+)
+from ..core import get_theme_manager
+from ..scraper import main_scraping_function, TweetExporter
 from ..analysis import SentimentAnalyzer, TrendDetector
 from .signals import LoggerSignals
 from .analytics_dashboard import AnalyticsDashboard
+from .tweet_table_model import TweetTableModel
+
+# dtype eksplisit untuk CSV hasil scraping: melewati inferensi tipe, dan
+# username/handle yang banyak berulang disimpan sebagai category
+_TWEET_CSV_DTYPES = {field: str for field in TWEET_FIELDS}
+_TWEET_CSV_DTYPES.update(username='category', handle='category')
+
+# Kata kunci log -> teks status bar, urut prioritas (kata kunci pertama
+# yang ada di baris menang, bukan yang paling kiri)
+_STATUS_KEYWORDS = (
+    ('tweet', "Scraping in progress..."),
+    ('selesai', "Scraping completed"),
+    ('error', "Error occurred"),
+    ('gagal', "Error occurred"),
+)
+
+
+def _status_for(text: str):
+    """Teks status bar untuk satu baris log, atau None jika tidak ada kata kunci."""
+    lowered = text.lower()
+    for keyword, status in _STATUS_KEYWORDS:
+        if keyword in lowered:
+            return status
+    return None
+
+# Format teks label statistik, per key dari ProgressTracker.get_statistics()
+_STATS_LABEL_FORMATS = {
+    'current_speed': "⚡ Kecepatan: {}",
+    'session_eta': "⏱️ ETA: {}",
+    'tweets_collected': "📊 Tweet: {}",
+    'total_progress': "📈 Total: {}",
+}
 
 
 class TweetScraperGUIV2(QWidget):
@@ -36,7 +73,7 @@ class TweetScraperGUIV2(QWidget):
         self.current_dataframe = None  # Store scraped data
 
         # Initialize theme manager
-        self.theme_manager = ThemeManager()
+        self.theme_manager = get_theme_manager()
 
         # Initialize analysis modules
         self.sentiment_analyzer = SentimentAnalyzer()
@@ -45,10 +82,23 @@ class TweetScraperGUIV2(QWidget):
         self.signals.log_signal.connect(self.append_log)
         self.signals.finished_signal.connect(self.on_scraping_finished)
         self.signals.progress_signal.connect(self.update_progress)
-        self.signals.data_row_signal.connect(self.add_data_row)
-        self.signals.stats_signal.connect(self.update_stats)
+        self.signals.data_row_signal.connect(self.add_data_rows)
         self.signals.notification_signal.connect(self.show_notification)
 
+        # Statistik live di-refresh pada 5 Hz, terlepas dari kecepatan scraping
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(STATS_REFRESH_INTERVAL_MS)
+        self.stats_timer.timeout.connect(self.refresh_live_stats)
+        # Nilai terakhir yang tampil di tiap label statistik
+        self._shown_stats: Dict[str, Any] = {}
+
+        # Log di-buffer dan ditulis ke panel Log maksimal 10x per detik
+        self._log_buffer: deque = deque(maxlen=LOG_BUFFER_SIZE)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
         # Setup System Tray
         self.setup_tray_icon()
 
@@ -56,7 +106,8 @@ class TweetScraperGUIV2(QWidget):
         self.init_ui()
 
         # Apply initial theme
-        self.setStyleSheet(self.theme_manager.get_current_theme_style())
+        self._applied_style = None
+        self.apply_theme_style()
 
     def init_ui(self):
         """Initialize UI dengan navbar dan stacked pages."""
@@ -277,7 +328,7 @@ class TweetScraperGUIV2(QWidget):
 
         # Title
         title_label = QLabel("Scraper Configuration")
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; margin-bottom: 10px;")
+        title_label.setObjectName("titleLabel")
         left_layout.addWidget(title_label)
 
         # Input sections - MENGGUNAKAN GRID LAYOUT 2x2
@@ -307,12 +358,15 @@ class TweetScraperGUIV2(QWidget):
         self.tabs.setMinimumHeight(400)
 
         # Log tab
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.tabs.addTab(self.log_output, "📝 Log")
 
         # Data preview tab
-        self.data_table = QTableWidget()
+        self.table_model = TweetTableModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.table_model)
         self.data_table.setAlternatingRowColors(True)
         self.tabs.addTab(self.data_table, "📋 Data Preview")
 
@@ -454,7 +508,7 @@ class TweetScraperGUIV2(QWidget):
         # Export format
         options_layout.addWidget(QLabel("Format:"))
         self.export_format_combo = QComboBox()
-        self.export_format_combo.addItems(["CSV", "JSON", "Excel"])
+        self.export_format_combo.addItems(["CSV", "JSON", "Excel", "Parquet"])
         self.export_format_combo.setMinimumHeight(30)
         options_layout.addWidget(self.export_format_combo)
 
@@ -624,9 +678,9 @@ class TweetScraperGUIV2(QWidget):
             'total_progress': QLabel("📈 Total: 0%")
         }
 
-        # Style the labels
+        # Style the labels (QLabel[statPill="true"] di stylesheet tema)
         for label in self.stats_labels.values():
-            label.setStyleSheet("font-size: 11px; padding: 5px; border: 1px solid #ddd; border-radius: 4px; background-color: #f9f9f9;")
+            label.setProperty("statPill", True)
 
         # Arrange in Grid
         stats_layout.addWidget(self.stats_labels['current_speed'], 0, 0)
@@ -638,26 +692,13 @@ class TweetScraperGUIV2(QWidget):
         parent_layout.addWidget(progress_group)
 
     def setup_table(self):
-        """Setup data table columns"""
-        self.data_table.setColumnCount(8)
-        self.data_table.setHorizontalHeaderLabels([
-            "Username", "Handle", "Timestamp", "Tweet Text",
-            "URL", "Replies", "Retweets", "Likes"
-        ])
+        """Reset data table rows and column widths"""
+        self.table_model.clear()
         self.data_table.setColumnWidth(3, 300)
 
-    def add_data_row(self, data: Dict[str, Any]):
-        """Add a row to the data table"""
-        row_position = self.data_table.rowCount()
-        self.data_table.insertRow(row_position)
-        self.data_table.setItem(row_position, 0, QTableWidgetItem(data.get("username")))
-        self.data_table.setItem(row_position, 1, QTableWidgetItem(data.get("handle")))
-        self.data_table.setItem(row_position, 2, QTableWidgetItem(data.get("timestamp")))
-        self.data_table.setItem(row_position, 3, QTableWidgetItem(data.get("tweet_text")))
-        self.data_table.setItem(row_position, 4, QTableWidgetItem(data.get("url")))
-        self.data_table.setItem(row_position, 5, QTableWidgetItem(data.get("reply_count")))
-        self.data_table.setItem(row_position, 6, QTableWidgetItem(data.get("retweet_count")))
-        self.data_table.setItem(row_position, 7, QTableWidgetItem(data.get("like_count")))
+    def add_data_rows(self, rows: List[Dict[str, Any]]):
+        """Add a batch of rows to the data table model"""
+        self.table_model.append_rows(rows)
 
     def update_progress(self, value, maximum):
         """Update progress bar"""
@@ -665,28 +706,43 @@ class TweetScraperGUIV2(QWidget):
         self.progress_bar.setValue(value)
 
     def update_stats(self, stats: Dict[str, Any]):
-        """Update progress statistics display"""
-        if 'current_speed' in stats:
-            self.stats_labels['current_speed'].setText(f"⚡ Kecepatan: {stats['current_speed']}")
-        if 'session_eta' in stats:
-            self.stats_labels['session_eta'].setText(f"⏱️ ETA: {stats['session_eta']}")
-        if 'tweets_collected' in stats:
-            self.stats_labels['tweets_collected'].setText(f"📊 Tweet: {stats['tweets_collected']}")
-        if 'total_progress' in stats:
-            self.stats_labels['total_progress'].setText(f"📈 Total: {stats['total_progress']}")
+        """Update progress statistics display (hanya label yang nilainya berubah)"""
+        for key, label_format in _STATS_LABEL_FORMATS.items():
+            value = stats.get(key)
+            if value is None or value == self._shown_stats.get(key):
+                continue
+            self._shown_stats[key] = value
+            self.stats_labels[key].setText(label_format.format(value))
+
+    def refresh_live_stats(self):
+        """Apply the latest worker statistics to the progress bar and labels"""
+        stats = self.signals.live_stats.copy()
+        if not stats:
+            return
+        if 'progress' in stats:
+            self.update_progress(*stats['progress'])
+        self.update_stats(stats)
 
     def append_log(self, text: str):
-        """Append text to log output"""
-        self.log_output.append(text)
+        """Append text to log output (ditulis pada flush berikutnya)"""
+        self._log_buffer.append(text)
+
+    def _flush_log(self):
+        """Write buffered log lines to the log panel in one append"""
+        if not self._log_buffer:
+            return
+        lines = list(self._log_buffer)
+        self._log_buffer.clear()
+
+        self.log_output.appendPlainText("\n".join(lines))
         self.log_output.verticalScrollBar().setValue(self.log_output.verticalScrollBar().maximum())
 
-        # Update status bar with latest activity
-        if "tweet" in text.lower():
-            self.status_label.setText("Scraping in progress...")
-        elif "selesai" in text.lower():
-            self.status_label.setText("Scraping completed")
-        elif "error" in text.lower() or "gagal" in text.lower():
-            self.status_label.setText("Error occurred")
+        # Update status bar with latest activity (baris terakhir yang cocok)
+        for text in reversed(lines):
+            status = _status_for(text)
+            if status:
+                self.status_label.setText(status)
+                break
 
     def update_database_status(self, count: int):
         """Update database status in status bar"""
@@ -710,11 +766,12 @@ class TweetScraperGUIV2(QWidget):
             self.append_log("❌ Error: Auth token cookie diperlukan!")
             return
 
+        self._log_buffer.clear()
         self.log_output.clear()
-        self.data_table.setRowCount(0)
         self.setup_table()
         self.progress_bar.setValue(0)
         self.stop_event.clear()
+        self.signals.live_stats.clear()
 
         # Update status
         self.status_label.setText("Initializing scraping...")
@@ -761,6 +818,7 @@ class TweetScraperGUIV2(QWidget):
         self.stop_button.setEnabled(True)
         self.status_label.setText("Scraping started...")
 
+        self.stats_timer.start()
         self.scraping_thread = Thread(target=self.run_scraper_thread, args=(args,))
         self.scraping_thread.start()
 
@@ -792,43 +850,39 @@ class TweetScraperGUIV2(QWidget):
                     date_ranges.append((current_date, chunk_end_date))
                     current_date = chunk_end_date
 
-                # Run parallel scraping
-                all_tweets = scraper.scrape_parallel(
-                    keyword=args['keyword'],
-                    date_ranges=date_ranges,
-                    target_per_session=args['target_per_session'],
-                    lang=args['lang'],
-                    search_type=args['search_type'],
-                    auth_token=args['auth_token_cookie']
-                )
-
-                # Save results
-                if all_tweets:
-                    df = pd.DataFrame(all_tweets)
-
-                    # Generate filename
-                    safe_keyword = "".join(c for c in args['keyword'] if c.isalnum())
-                    date_str = f"{start_date.strftime('%Y%m%d')}-{end_date.strftime('%Y%m%d')}"
-                    base_filename = f"tweets_{safe_keyword}_{args['search_type']}_{date_str}"
-
-                    export_format = args['export_format']
+                # Generate filename
+                safe_keyword = "".join(c for c in args['keyword'] if c.isalnum())
+                date_str = f"{start_date.strftime('%Y%m%d')}-{end_date.strftime('%Y%m%d')}"
+                base_filename = f"tweets_{safe_keyword}_{args['search_type']}_{date_str}"
+                exporter = TweetExporter(base_filename, args['export_format'])
+
+                # Run parallel scraping; hasil tiap sesi langsung ditulis ke file.
+                # File output selalu ditutup (penutup JSON, save workbook, footer
+                # Parquet) agar baris yang sudah ditulis tetap valid saat error.
+                filename = None
+                try:
+                    scraper.scrape_parallel(
+                        keyword=args['keyword'],
+                        date_ranges=date_ranges,
+                        target_per_session=args['target_per_session'],
+                        lang=args['lang'],
+                        search_type=args['search_type'],
+                        auth_token=args['auth_token_cookie'],
+                        on_results=exporter.write_rows
+                    )
+                finally:
+                    scraper.close()
                     try:
-                        if export_format == 'CSV':
-                            filename = f"{base_filename}.csv"
-                            df.to_csv(filename, index=False, encoding='utf-8-sig')
-                        elif export_format == 'JSON':
-                            filename = f"{base_filename}.json"
-                            df.to_json(filename, orient='records', indent=4)
-                        elif export_format == 'Excel':
-                            filename = f"{base_filename}.xlsx"
-                            df.to_excel(filename, index=False)
-
-                        self.signals.log_signal.emit(f"\n✅ Data disimpan ke: {filename} ({len(df)} tweet)")
-                        self.signals.notification_signal.emit("Scraping Selesai", f"Berhasil menyimpan {len(df)} tweet ke {filename}")
+                        filename = exporter.close()
                     except Exception as e:
                         self.signals.log_signal.emit(f"\n!!! Gagal menyimpan file: {e} !!!")
-                else:
+
+                # Save results
+                if not exporter.count:
                     self.signals.log_signal.emit("\n⚠️ Tidak ada data yang terkumpul.")
+                elif filename:
+                    self.signals.log_signal.emit(f"\n✅ Data disimpan ke: {filename} ({exporter.count} tweet)")
+                    self.signals.notification_signal.emit("Scraping Selesai", f"Berhasil menyimpan {exporter.count} tweet ke {filename}")
 
             else:
                 # Use original single-threaded scraping
@@ -848,6 +902,8 @@ class TweetScraperGUIV2(QWidget):
 
     def on_scraping_finished(self):
         """Handle scraping finished - save data for analytics."""
+        self.stats_timer.stop()
+        self.refresh_live_stats()
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.append_log("\n--- Proses Selesai ---")
@@ -867,7 +923,7 @@ class TweetScraperGUIV2(QWidget):
             files = [f for f in os.listdir('.') if f.startswith('tweets_') and f.endswith('.csv')]
             if files:
                 latest_file = max(files, key=os.path.getctime)
-                self.current_dataframe = pd.read_csv(latest_file)
+                self.current_dataframe = pd.read_csv(latest_file, dtype=_TWEET_CSV_DTYPES)
                 self.append_log(f"✅ Data loaded: {latest_file} ({len(self.current_dataframe)} tweets)")
         except Exception as e:
             self.append_log(f"⚠️ Gagal load data: {e}")
@@ -878,15 +934,17 @@ class TweetScraperGUIV2(QWidget):
             self,
             "Load Data File",
             "",
-            "CSV Files (*.csv);;Excel Files (*.xlsx);;All Files (*)"
+            "CSV Files (*.csv);;Excel Files (*.xlsx);;Parquet Files (*.parquet);;All Files (*)"
         )
 
         if file_path:
             try:
                 if file_path.endswith('.csv'):
-                    self.current_dataframe = pd.read_csv(file_path)
+                    self.current_dataframe = pd.read_csv(file_path, dtype=_TWEET_CSV_DTYPES)
                 elif file_path.endswith('.xlsx'):
                     self.current_dataframe = pd.read_excel(file_path)
+                elif file_path.endswith('.parquet'):
+                    self.current_dataframe = pd.read_parquet(file_path)
                 else:
                     QMessageBox.warning(self, "Error", "Format file tidak didukung!")
                     return
@@ -928,8 +986,16 @@ class TweetScraperGUIV2(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Gagal melakukan analisis: Pastikan column tweet_text ada di data\n{e}")
 
+    def apply_theme_style(self):
+        """Apply stylesheet tema saat ini; dilewati jika sama dengan yang terpasang."""
+        style = self.theme_manager.get_current_theme_style()
+        if style is self._applied_style:
+            return
+        self.setStyleSheet(style)
+        self._applied_style = style
+
     def toggle_theme(self):
         """Toggle theme."""
         new_theme = self.theme_manager.toggle_theme()
-        self.setStyleSheet(self.theme_manager.get_current_theme_style())
+        self.apply_theme_style()
         self.theme_button.setText(self.theme_manager.get_theme_button_text())
\ No newline at end of file
@@ -2,6 +2,8 @@
 Qt signals for communication between threads and GUI.
 """
 
+from typing import Dict, Any
+
 from PyQt5.QtCore import QObject, pyqtSignal
 
 
@@ -10,6 +12,11 @@ class LoggerSignals(QObject):
     log_signal = pyqtSignal(str)
     finished_signal = pyqtSignal()
     progress_signal = pyqtSignal(int, int)
-    data_row_signal = pyqtSignal(dict)
-    stats_signal = pyqtSignal(dict)  # Signal for progress statistics
+    data_row_signal = pyqtSignal(list)  # Batch of tweet dicts
     notification_signal = pyqtSignal(str, str)  # title, message
+
+    def __init__(self):
+        super().__init__()
+        # Statistik progress terbaru; ditulis worker via dict.update (atomik
+        # di bawah GIL) dan dibaca GUI lewat QTimer, bukan per-emit signal
+        self.live_stats: Dict[str, Any] = {}
@@ -0,0 +1,81 @@
+"""
+Model tabel virtual untuk Data Preview tweet.
+"""
+
+from operator import itemgetter
+from typing import Dict, Any, List, Tuple
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from ..config.constants import TWEET_FIELDS
+
+# Ambil nilai semua kolom dari dict tweet sekaligus, urut sesuai TWEET_FIELDS
+_row_values = itemgetter(*TWEET_FIELDS)
+
+
+class TweetTableModel(QAbstractTableModel):
+    """
+    Model Qt yang membaca langsung dari list baris tweet.
+
+    Berbeda dengan QTableWidget, tidak ada QTableWidgetItem per sel: view
+    hanya meminta data untuk baris yang terlihat, dan penambahan batch
+    cukup memperpanjang list. Setiap dict tweet diubah sekali menjadi
+    tuple posisional saat ditambahkan, sehingga data() cukup mengindeks
+    tuple tanpa lookup dict per sel.
+
+    Attributes:
+        rows (List[Tuple[Any, ...]]): Data tweet, satu tuple per baris
+    """
+
+    HEADERS = (
+        "Username", "Handle", "Timestamp", "Tweet Text",
+        "URL", "Replies", "Retweets", "Likes"
+    )
+
+    def __init__(self, parent=None):
+        """
+        Inisialisasi TweetTableModel.
+
+        Args:
+            parent (QObject): Parent Qt object
+        """
+        super().__init__(parent)
+        self.rows: List[Tuple[Any, ...]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(TWEET_FIELDS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self.rows[index.row()][index.column()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def append_rows(self, rows: List[Dict[str, Any]]):
+        """
+        Tambahkan satu batch tweet di akhir tabel.
+
+        Args:
+            rows (List[Dict[str, Any]]): Batch tweet dari data_row_signal
+        """
+        if not rows:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(map(_row_values, rows))
+        self.endInsertRows()
+
+    def clear(self):
+        """Kosongkan semua baris."""
+        self.beginResetModel()
+        self.rows = []
+        self.endResetModel()
@@ -1,8 +1,9 @@
 """Scraper modules for Tweet Scraper."""
 
 from .driver_setup import setup_driver
-from .tweet_parser import parse_tweet_article
+from .tweet_parser import parse_tweet_article, parse_tweet_articles
 from .tweet_scraper import scrape_tweets, main_scraping_function
 from .parallel_scraper import ParallelScraper
+from .tweet_exporter import TweetExporter
 
-__all__ = ['setup_driver', 'parse_tweet_article', 'scrape_tweets', 'main_scraping_function', 'ParallelScraper']
+__all__ = ['setup_driver', 'parse_tweet_article', 'parse_tweet_articles', 'scrape_tweets', 'main_scraping_function', 'ParallelScraper', 'TweetExporter']
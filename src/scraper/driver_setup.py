@@ -57,6 +57,14 @@ def setup_driver() -> webdriver.Chrome:
     chrome_options.add_argument("--log-level=3")
     chrome_options.add_argument(f'user-agent={DEFAULT_USER_AGENT}')
 
+    # Scraping hanya butuh teks DOM: jangan unduh gambar/media, dan
+    # driver.get() kembali pada DOMContentLoaded (bukan event load)
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2
+    })
+    chrome_options.page_load_strategy = "eager"
+
     # Gunakan cached driver path (thread-safe)
     service = Service(get_driver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
@@ -2,9 +2,9 @@
 Parallel Scraper untuk multi-threading scraping.
 """
 
-from typing import Dict, List, Any, Optional
-from threading import Thread, Lock, Event
-from queue import Queue
+from typing import Dict, List, Any, Optional, Callable
+from threading import Lock, Event, local
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 from datetime import datetime, timedelta
 
@@ -19,12 +19,14 @@ class ParallelScraper:
     """
     Scraper paralel dengan multiple browser instances.
 
-    Menggunakan thread pool untuk scraping paralel, meningkatkan
-    kecepatan scraping hingga 3-5x lebih cepat.
+    Menggunakan ThreadPoolExecutor untuk scraping paralel, meningkatkan
+    kecepatan scraping hingga 3-5x lebih cepat. Setiap thread di pool
+    memiliki satu driver yang dipakai ulang untuk semua sesi yang
+    dikerjakannya, lalu ditutup setelah semua sesi selesai.
 
     Features:
     - Multiple browser instances (configurable)
-    - Task queue distribution
+    - Driver pool (satu driver per thread)
     - Thread-safe deduplication
     - Progress aggregation
     - Auto error recovery
@@ -52,9 +54,10 @@ class ParallelScraper:
         self.stop_event = stop_event or Event()
 
         # Thread-safe components
-        self.task_queue = Queue()
-        self.result_queue = Queue()
         self.lock = Lock()
+        self._local = local()
+        self._drivers = []
+        self._worker_count = 0
 
         # Shared deduplicator (thread-safe dengan lock)
         self.deduplicator = AdvancedDeduplicator()
@@ -78,7 +81,8 @@ class ParallelScraper:
         target_per_session: int,
         lang: str = "id",
         search_type: str = "top",
-        auth_token: str = ""
+        auth_token: str = "",
+        on_results: Optional[Callable[[List[Dict[str, Any]]], Any]] = None
     ) -> List[Dict[str, Any]]:
         """
         Scraping paralel dengan multiple threads.
@@ -90,9 +94,13 @@ class ParallelScraper:
             lang (str): Bahasa
             search_type (str): Tipe pencarian
             auth_token (str): Auth token
+            on_results (Callable, optional): Dipanggil dengan tweet setiap
+                sesi begitu sesi selesai (misal TweetExporter.write_rows).
+                Jika diberikan, tweet tidak ditampung di memory.
 
         Returns:
             List[Dict[str, Any]]: List semua tweet yang berhasil di-scrape
+                (kosong jika on_results diberikan)
         """
         self.log(f"🚀 Memulai parallel scraping dengan {self.num_threads} threads...")
 
@@ -103,9 +111,10 @@ class ParallelScraper:
         get_driver_path()  # Install dan cache driver path
         self.log("✅ ChromeDriver siap digunakan")
 
-        # Populate task queue
+        # Build task list
+        tasks = []
         for idx, (start_date, end_date) in enumerate(date_ranges):
-            task = {
+            tasks.append({
                 'session_id': idx + 1,
                 'keyword': keyword,
                 'start_date': start_date,
@@ -114,98 +123,113 @@ class ParallelScraper:
                 'lang': lang,
                 'search_type': search_type,
                 'auth_token': auth_token
-            }
-            self.task_queue.put(task)
+            })
 
         self.log(f"📋 Total {len(date_ranges)} sesi akan di-scrape secara paralel")
 
-        # Start worker threads
-        threads = []
-        for i in range(self.num_threads):
-            thread = Thread(target=self._worker, args=(i + 1,))
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-            self.active_threads += 1
-
-        # Wait for all tasks to complete
-        self.task_queue.join()
-
-        # Stop all threads
-        for _ in range(self.num_threads):
-            self.task_queue.put(None)  # Poison pill
-
-        for thread in threads:
-            thread.join()
-
-        # Collect all results
+        # Submit semua sesi ke thread pool; tiap thread memakai driver-nya sendiri
         all_tweets = []
-        while not self.result_queue.empty():
-            tweets = self.result_queue.get()
-            all_tweets.extend(tweets)
+        total = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.num_threads, thread_name_prefix="scraper") as executor:
+                futures = [executor.submit(self._run_task, task) for task in tasks]
+                for future in as_completed(futures):
+                    tweets = future.result()
+                    total += len(tweets)
+                    if on_results is None:
+                        all_tweets.extend(tweets)
+                    elif tweets:
+                        try:
+                            on_results(tweets)
+                        except Exception:
+                            # Hentikan sesi lain segera; keluar dari blok with
+                            # menunggu semua future, jadi jangan biarkan sesi
+                            # tersisa scraping sampai selesai lalu dibuang
+                            self.stop_event.set()
+                            for pending in futures:
+                                pending.cancel()
+                            raise
+        finally:
+            self._close_drivers()
 
-        self.log(f"✅ Parallel scraping selesai! Total: {len(all_tweets)} tweets")
+        self.log(f"✅ Parallel scraping selesai! Total: {total} tweets")
 
         if self.errors:
             self.log(f"⚠️ {len(self.errors)} error terjadi selama scraping")
 
         return all_tweets
 
-    def _worker(self, worker_id: int):
+    def _get_driver(self):
         """
-        Worker thread untuk scraping.
+        Ambil driver milik thread saat ini, buat baru jika belum ada.
 
-        Args:
-            worker_id (int): ID worker thread
+        Returns:
+            Tuple (worker_id, driver) untuk thread ini
         """
-        self.log(f"🔧 Worker #{worker_id} started")
-        driver = None
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            with self.lock:
+                self._worker_count += 1
+                worker_id = self._worker_count
 
-        try:
-            # Setup driver untuk worker ini
+            self.log(f"🔧 Worker #{worker_id} started")
             driver = setup_driver()
-            self.log(f"✅ Worker #{worker_id} driver ready")
+            self._local.driver = driver
+            self._local.worker_id = worker_id
 
-            while not self.stop_event.is_set():
-                # Get task from queue
-                task = self.task_queue.get()
+            with self.lock:
+                self._drivers.append((worker_id, driver))
+                self.active_threads += 1
+            self.log(f"✅ Worker #{worker_id} driver ready")
 
-                if task is None:  # Poison pill
-                    break
+        return self._local.worker_id, driver
 
-                try:
-                    self.log(f"🔄 Worker #{worker_id} processing session {task['session_id']}")
+    def _run_task(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Jalankan satu sesi scraping di thread pool.
 
-                    # Scrape tweets untuk task ini
-                    tweets = self._scrape_session(driver, task, worker_id)
+        Args:
+            task (Dict[str, Any]): Task dictionary
 
-                    # Put results in result queue
-                    self.result_queue.put(tweets)
+        Returns:
+            List[Dict[str, Any]]: List tweets (kosong jika dihentikan/error)
+        """
+        if self.stop_event.is_set():
+            return []
 
-                    with self.lock:
-                        self.total_scraped += len(tweets)
+        worker_id = 0
+        try:
+            worker_id, driver = self._get_driver()
+            self.log(f"🔄 Worker #{worker_id} processing session {task['session_id']}")
 
-                    self.log(f"✅ Worker #{worker_id} selesai session {task['session_id']}: {len(tweets)} tweets")
+            # Scrape tweets untuk task ini
+            tweets = self._scrape_session(driver, task, worker_id)
 
-                except Exception as e:
-                    error_msg = f"❌ Worker #{worker_id} error pada session {task['session_id']}: {e}"
-                    self.log(error_msg)
-                    self.errors.append(error_msg)
-                    self.result_queue.put([])  # Empty result
+            with self.lock:
+                self.total_scraped += len(tweets)
 
-                finally:
-                    self.task_queue.task_done()
+            self.log(f"✅ Worker #{worker_id} selesai session {task['session_id']}: {len(tweets)} tweets")
+            return tweets
 
         except Exception as e:
-            self.log(f"❌ Worker #{worker_id} fatal error: {e}")
-
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                    self.log(f"🔧 Worker #{worker_id} driver closed")
-                except:
-                    pass
+            error_msg = f"❌ Worker #{worker_id} error pada session {task['session_id']}: {e}"
+            self.log(error_msg)
+            with self.lock:
+                self.errors.append(error_msg)
+            return []
+
+    def _close_drivers(self):
+        """Tutup semua driver di pool."""
+        with self.lock:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+
+        for worker_id, driver in drivers:
+            try:
+                driver.quit()
+                self.log(f"🔧 Worker #{worker_id} driver closed")
+            except:
+                pass
 
             with self.lock:
                 self.active_threads -= 1
@@ -261,6 +285,10 @@ class ParallelScraper:
 
         return tweets
 
+    def close(self):
+        """Tutup koneksi database deduplicator bersama."""
+        self.deduplicator.close()
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Dapatkan statistik scraping.
@@ -0,0 +1,182 @@
+"""
+Streaming export hasil scraping ke file CSV, JSON, atau Excel.
+"""
+
+import codecs
+import csv
+import json
+from typing import Dict, Any, Iterable, List, Optional
+
+from ..config.constants import TWEET_FIELDS, EXPORT_EXTENSIONS
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class TweetExporter:
+    """
+    Menulis tweet ke file secara bertahap (per sesi) tanpa menampung
+    seluruh hasil scraping di memory.
+
+    File baru dibuat saat baris pertama ditulis, sehingga tidak ada file
+    kosong jika scraping tidak menghasilkan data. Setiap batch di-flush ke
+    disk agar data sesi yang sudah selesai tidak hilang jika proses crash.
+
+    - CSV: pyarrow CSVWriter per batch jika pyarrow terinstall, fallback
+      ke csv.DictWriter (keduanya utf-8 dengan BOM)
+    - JSON: array of records yang ditulis per elemen
+    - Excel: openpyxl workbook mode write-only
+    - Parquet: pyarrow ParquetWriter (kompresi zstd), satu row group per batch
+
+    Attributes:
+        filename (str): Path file output
+        export_format (str): 'CSV', 'JSON', 'Excel', atau 'Parquet'
+        count (int): Jumlah tweet yang sudah ditulis
+
+    Example:
+        >>> exporter = TweetExporter("tweets_python", "CSV")
+        >>> exporter.write_rows(session_data)
+        >>> exporter.close()
+    """
+
+    def __init__(self, base_filename: str, export_format: str):
+        """
+        Inisialisasi TweetExporter.
+
+        Args:
+            base_filename (str): Nama file tanpa ekstensi
+            export_format (str): 'CSV', 'JSON', 'Excel', atau 'Parquet'
+
+        Raises:
+            ValueError: Jika format export tidak dikenal
+            ImportError: Jika format Parquet dipilih tanpa pyarrow
+        """
+        if export_format not in EXPORT_EXTENSIONS:
+            raise ValueError(f"Format export tidak dikenal: {export_format}")
+        if export_format == 'Parquet' and not PYARROW_AVAILABLE:
+            raise ImportError("Export Parquet membutuhkan pyarrow (pip install pyarrow)")
+
+        self.export_format = export_format
+        self.filename = f"{base_filename}{EXPORT_EXTENSIONS[export_format]}"
+        self.count = 0
+        self._opened = False
+        self._file = None
+        self._writer = None
+        self._schema = None
+        self._workbook = None
+        self._sheet = None
+
+    def _open(self):
+        """Buka file output dan tulis header sesuai format."""
+        self._opened = True
+        if self.export_format == 'Parquet':
+            self._schema = self._arrow_schema()
+            self._writer = pq.ParquetWriter(self.filename, self._schema, compression='zstd')
+        elif self.export_format == 'CSV' and PYARROW_AVAILABLE:
+            self._file = open(self.filename, 'wb')
+            self._file.write(codecs.BOM_UTF8)
+            self._schema = self._arrow_schema()
+            self._writer = pacsv.CSVWriter(self._file, self._schema)
+        elif self.export_format == 'CSV':
+            self._file = open(self.filename, 'w', encoding='utf-8-sig', newline='')
+            self._writer = csv.DictWriter(self._file, fieldnames=TWEET_FIELDS, extrasaction='ignore')
+            self._writer.writeheader()
+        elif self.export_format == 'JSON':
+            self._file = open(self.filename, 'w', encoding='utf-8')
+            self._file.write('[')
+        elif self.export_format == 'Excel':
+            from openpyxl import Workbook
+            self._workbook = Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet()
+            self._sheet.append(TWEET_FIELDS)
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Tulis sekumpulan tweet ke file.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): Data tweet (dict per tweet)
+
+        Returns:
+            int: Jumlah tweet yang ditulis pada panggilan ini
+        """
+        if self.export_format == 'Parquet' or (self.export_format == 'CSV' and PYARROW_AVAILABLE):
+            return self._write_arrow_batch(list(rows))
+
+        written = 0
+        for row in rows:
+            if not self._opened:
+                self._open()
+
+            if self.export_format == 'CSV':
+                self._writer.writerow(row)
+            elif self.export_format == 'JSON':
+                record = {field: row.get(field) for field in TWEET_FIELDS}
+                self._file.write(',\n' if self.count + written else '\n')
+                self._file.write(json.dumps(record, indent=4))
+            else:
+                self._sheet.append([row.get(field) for field in TWEET_FIELDS])
+            written += 1
+
+        self.count += written
+        if written and self._file is not None:
+            self._file.flush()
+        return written
+
+    @staticmethod
+    def _arrow_schema() -> 'pa.Schema':
+        """Schema Arrow: semua kolom tweet bertipe string."""
+        return pa.schema([(field, pa.string()) for field in TWEET_FIELDS])
+
+    def _write_arrow_batch(self, rows: List[Dict[str, Any]]) -> int:
+        """Tulis satu batch CSV/Parquet lewat pyarrow (konversi kolom di C++)."""
+        if not rows:
+            return 0
+        if not self._opened:
+            self._open()
+
+        columns = [
+            [None if row.get(field) is None else str(row.get(field)) for row in rows]
+            for field in TWEET_FIELDS
+        ]
+        self._writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=self._schema))
+        if self._file is not None:
+            self._file.flush()
+        self.count += len(rows)
+        return len(rows)
+
+    def close(self) -> Optional[str]:
+        """
+        Selesaikan dan tutup file output. Aman dipanggil berkali-kali.
+
+        Handle dilepas sebelum ditutup, sehingga close yang gagal (mis.
+        file .xlsx sedang dibuka di Excel) tidak diulang oleh pemanggilan
+        berikutnya.
+
+        Returns:
+            Optional[str]: Nama file jika ada data yang ditulis, None jika tidak
+        """
+        writer, file, workbook = self._writer, self._file, self._workbook
+        self._writer = self._file = self._workbook = self._sheet = None
+
+        if file is None:
+            # Parquet: ParquetWriter memegang file-nya sendiri
+            if writer is not None and self.export_format == 'Parquet':
+                writer.close()
+        else:
+            try:
+                if self._schema is not None:
+                    writer.close()
+                if self.export_format == 'JSON':
+                    file.write('\n]\n')
+            finally:
+                file.close()
+        if workbook is not None:
+            workbook.save(self.filename)
+
+        return self.filename if self.count else None
@@ -2,9 +2,149 @@
 Tweet parsing functionality.
 """
 
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException
+)
+
+
+# Fungsi JS yang mengekstrak semua field dari satu article tweet di browser,
+# sehingga satu execute_script menggantikan 8 find_element per tweet.
+# Artikel yang tidak lengkap dikembalikan sebagai null (sama seperti
+# parse_tweet_article yang mengembalikan None). Artikel yang berhasil
+# diekstrak ditandai dengan URL-nya, sehingga setelah scroll hanya node
+# baru (atau node yang di-recycle untuk tweet lain) yang diproses ulang.
+_EXTRACT_FN_JS = """
+const firstTextContains = (el, needle) => {
+    const node = Array.from(el.childNodes).find(n => n.nodeType === Node.TEXT_NODE);
+    return !!node && node.textContent.includes(needle);
+};
+const findSpan = (root, needle) =>
+    Array.from(root.querySelectorAll('span')).find(s => firstTextContains(s, needle));
+
+const extract = (article) => {
+    const link = article.querySelector("a[href*='/status/']");
+    const url = link ? link.href : null;
+    if (!url || article.dataset.scrapedUrl === url) return null;
+
+    const userName = article.querySelector("div[data-testid='User-Name']");
+    const username = userName && userName.querySelector('span');
+    // Handle selalu berada di blok User-Name; cukup scan span di sana
+    // daripada seluruh span di article
+    const handle = userName && findSpan(userName, '@');
+    const time = article.querySelector('time');
+
+    const showMore = findSpan(article, 'Show more');
+    if (showMore) {
+        try { showMore.click(); } catch (e) {}
+    }
+
+    const text = article.querySelector("div[data-testid='tweetText']");
+    const reply = article.querySelector("button[data-testid='reply']");
+    const retweet = article.querySelector("button[data-testid='retweet']");
+    const like = article.querySelector("button[data-testid='like']");
+    if (!username || !handle || !time || !text || !reply || !retweet || !like) return null;
+
+    article.dataset.scrapedUrl = url;
+    return {
+        username: username.innerText,
+        handle: handle.innerText,
+        timestamp: time.getAttribute('datetime'),
+        tweet_text: text.innerText.replace(/\\n/g, ' '),
+        url: url,
+        reply_count: reply.innerText || '0',
+        retweet_count: retweet.innerText || '0',
+        like_count: like.innerText || '0'
+    };
+};
+"""
+
+EXTRACT_TWEETS_JS = _EXTRACT_FN_JS + """
+return Array.from(document.querySelectorAll("article[data-testid='tweet']")).map(extract);
+"""
+
+# Harvester yang berjalan di dalam browser: MutationObserver mengekstrak
+# article baru begitu dirender dan setInterval melakukan scroll otomatis.
+# Hasilnya ditampung di window.__harvest dan diambil Python secara berkala
+# dengan HARVEST_POLL_JS, sehingga loop scroll tidak perlu bolak-balik
+# ke Chromedriver. arguments[0] adalah interval scroll dalam milidetik.
+HARVEST_JS = _EXTRACT_FN_JS + """
+const intervalMs = arguments[0];
+if (window.__harvestTimer) clearInterval(window.__harvestTimer);
+if (window.__harvestObserver) window.__harvestObserver.disconnect();
+window.__harvest = [];
+
+let pending = false;
+const collect = () => {
+    pending = false;
+    document.querySelectorAll("article[data-testid='tweet']").forEach(article => {
+        const tweet = extract(article);
+        if (tweet) window.__harvest.push(tweet);
+    });
+};
+const schedule = () => {
+    if (!pending) {
+        pending = true;
+        setTimeout(collect, 100);
+    }
+};
+
+window.__harvestObserver = new MutationObserver(schedule);
+window.__harvestObserver.observe(document.querySelector('main') || document.body, {childList: true, subtree: true});
+window.__harvestTimer = setInterval(() => {
+    collect();
+    window.scrollTo(0, document.body.scrollHeight);
+}, intervalMs);
+collect();
+return true;
+"""
+
+# Mengambil isi window.__harvest sekaligus membandingkan tinggi halaman
+# dengan poll sebelumnya, sehingga deteksi "tidak ada konten baru" tidak
+# butuh round-trip scrollHeight terpisah.
+HARVEST_POLL_JS = """
+const height = document.body.scrollHeight;
+const grew = height !== window.__harvestHeight;
+window.__harvestHeight = height;
+return {tweets: window.__harvest ? window.__harvest.splice(0) : [], grew: grew};
+"""
+
+# Fallback tanpa harvester: scroll ke bawah dan laporkan apakah tinggi
+# halaman berubah sejak scroll sebelumnya, dalam satu execute_script.
+SCROLL_AND_CHECK_JS = """
+const height = document.body.scrollHeight;
+const grew = height !== window.__lastScrollHeight;
+window.__lastScrollHeight = height;
+window.scrollTo(0, height);
+return grew;
+"""
+
+HARVEST_STOP_JS = """
+if (window.__harvestTimer) clearInterval(window.__harvestTimer);
+if (window.__harvestObserver) window.__harvestObserver.disconnect();
+window.__harvestTimer = null;
+window.__harvestObserver = null;
+"""
+
+
+def _find_handle(tweet_article: Any) -> str:
+    """
+    Cari handle (@username) di blok User-Name dengan CSS selector.
+
+    CSS tidak bisa mencocokkan isi teks seperti XPath contains(text(), '@'),
+    jadi span kandidat diambil lalu dipilih yang diawali '@' di Python.
+
+    Raises:
+        NoSuchElementException: Jika handle tidak ditemukan
+    """
+    for span in tweet_article.find_elements(By.CSS_SELECTOR, "div[data-testid='User-Name'] a[href^='/'] span"):
+        text = span.text
+        if text.startswith('@'):
+            return text
+    raise NoSuchElementException("Handle tweet tidak ditemukan")
 
 
 def parse_tweet_article(tweet_article: Any, logger: Callable[[str], None]) -> Optional[Dict[str, Any]]:
@@ -19,16 +159,17 @@ def parse_tweet_article(tweet_article: Any, logger: Callable[[str], None]) -> Op
         Dict yang berisi data tweet atau None jika penguraian gagal
     """
     try:
-        tweet_url_elements = tweet_article.find_elements(By.XPATH, ".//a[contains(@href, '/status/')]")
+        tweet_url_elements = tweet_article.find_elements(By.CSS_SELECTOR, "a[href*='/status/']")
         tweet_url = tweet_url_elements[0].get_attribute('href') if tweet_url_elements else None
         if not tweet_url:
             return None
 
-        username = tweet_article.find_element(By.XPATH, ".//div[@data-testid='User-Name']//span").text
-        handle = tweet_article.find_element(By.XPATH, ".//span[contains(text(), '@')]").text
-        timestamp = tweet_article.find_element(By.XPATH, ".//time").get_attribute('datetime')
+        username = tweet_article.find_element(By.CSS_SELECTOR, "div[data-testid='User-Name'] span").text
+        handle = _find_handle(tweet_article)
+        timestamp = tweet_article.find_element(By.CSS_SELECTOR, "time").get_attribute('datetime')
         # Try to expand "Show more" if present
         try:
+            # Tetap XPath: pencocokan isi teks tidak bisa dilakukan dengan CSS
             show_more = tweet_article.find_elements(By.XPATH, ".//span[contains(text(), 'Show more')]")
             if show_more:
                 show_more[0].click()
@@ -38,10 +179,10 @@ def parse_tweet_article(tweet_article: Any, logger: Callable[[str], None]) -> Op
         except Exception:
             pass  # If click fails, continue with whatever text is visible
 
-        tweet_text = tweet_article.find_element(By.XPATH, ".//div[@data-testid='tweetText']").text.replace('\n', ' ')
-        reply_count = tweet_article.find_element(By.XPATH, ".//button[@data-testid='reply']").text or "0"
-        retweet_count = tweet_article.find_element(By.XPATH, ".//button[@data-testid='retweet']").text or "0"
-        like_count = tweet_article.find_element(By.XPATH, ".//button[@data-testid='like']").text or "0"
+        tweet_text = tweet_article.find_element(By.CSS_SELECTOR, "div[data-testid='tweetText']").text.replace('\n', ' ')
+        reply_count = tweet_article.find_element(By.CSS_SELECTOR, "button[data-testid='reply']").text or "0"
+        retweet_count = tweet_article.find_element(By.CSS_SELECTOR, "button[data-testid='retweet']").text or "0"
+        like_count = tweet_article.find_element(By.CSS_SELECTOR, "button[data-testid='like']").text or "0"
 
         return {
             "username": username,
@@ -56,3 +197,95 @@ def parse_tweet_article(tweet_article: Any, logger: Callable[[str], None]) -> Op
     except (NoSuchElementException, StaleElementReferenceException) as e:
         logger(f"Peringatan: Gagal mem-parsing satu tweet, melompati. Kesalahan: {e}")
         return None
+
+
+def parse_tweet_articles(driver: Any, logger: Callable[[str], None]) -> List[Dict[str, Any]]:
+    """
+    Parse semua article tweet baru di halaman dalam satu round-trip.
+
+    Article yang sudah diekstrak pada panggilan sebelumnya (setelah scroll)
+    dilewati di sisi browser.
+
+    Args:
+        driver: Selenium WebDriver instance
+        logger: Fungsi pencatatan untuk melaporkan kesalahan
+
+    Returns:
+        List dict data tweet (format sama dengan parse_tweet_article);
+        article yang gagal di-parse dilewati
+    """
+    try:
+        results = driver.execute_script(EXTRACT_TWEETS_JS)
+    except WebDriverException as e:
+        logger(f"Peringatan: Gagal mengekstrak tweet dari halaman. Kesalahan: {e}")
+        return []
+
+    return [tweet for tweet in results or [] if tweet]
+
+
+def start_harvest(driver: Any, interval_ms: int, logger: Callable[[str], None]) -> bool:
+    """
+    Pasang harvester JS yang melakukan scroll dan ekstraksi di browser.
+
+    Args:
+        driver: Selenium WebDriver instance
+        interval_ms: Jeda antar scroll otomatis dalam milidetik
+        logger: Fungsi pencatatan untuk melaporkan kesalahan
+
+    Returns:
+        True jika harvester berhasil dipasang
+    """
+    try:
+        return bool(driver.execute_script(HARVEST_JS, interval_ms))
+    except WebDriverException as e:
+        logger(f"Peringatan: Gagal memasang harvester. Kesalahan: {e}")
+        return False
+
+
+def collect_harvest(driver: Any, logger: Callable[[str], None]) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Ambil tweet yang sudah dikumpulkan harvester sejak panggilan terakhir.
+
+    Args:
+        driver: Selenium WebDriver instance
+        logger: Fungsi pencatatan untuk melaporkan kesalahan
+
+    Returns:
+        Tuple berisi list dict data tweet (format sama dengan
+        parse_tweet_article) dan flag apakah tinggi halaman bertambah
+        sejak poll sebelumnya
+    """
+    try:
+        result = driver.execute_script(HARVEST_POLL_JS) or {}
+    except WebDriverException as e:
+        logger(f"Peringatan: Gagal mengambil hasil harvester. Kesalahan: {e}")
+        return [], False
+
+    tweets = [tweet for tweet in result.get('tweets') or [] if tweet]
+    return tweets, bool(result.get('grew'))
+
+
+def scroll_and_check(driver: Any) -> bool:
+    """
+    Scroll ke bawah halaman dan cek apakah tinggi halaman berubah.
+
+    Args:
+        driver: Selenium WebDriver instance
+
+    Returns:
+        True jika tinggi halaman berubah sejak scroll sebelumnya
+    """
+    return bool(driver.execute_script(SCROLL_AND_CHECK_JS))
+
+
+def stop_harvest(driver: Any) -> None:
+    """
+    Hentikan harvester JS (scroll otomatis dan observer).
+
+    Args:
+        driver: Selenium WebDriver instance
+    """
+    try:
+        driver.execute_script(HARVEST_STOP_JS)
+    except WebDriverException:
+        pass
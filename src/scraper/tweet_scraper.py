@@ -2,18 +2,17 @@
 Main tweet scraping functionality.
 """
 
-import time
 import datetime
+from itertools import islice
 from typing import List, Dict, Any
 from threading import Event
 from urllib.parse import quote
 
-import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from ..config.constants import (
     SCROLL_PAUSE_TIME,
@@ -24,7 +23,58 @@ from ..config.constants import (
 )
 from ..core import AdvancedDeduplicator, ProgressTracker
 from .driver_setup import setup_driver
-from .tweet_parser import parse_tweet_article
+from .tweet_exporter import TweetExporter
+from .tweet_parser import (
+    parse_tweet_articles,
+    start_harvest,
+    collect_harvest,
+    stop_harvest,
+    scroll_and_check
+)
+
+
+def _navigate(driver: webdriver.Chrome, url: str) -> bool:
+    """
+    Buka URL; jika browser sudah berada di x.com, navigasi lewat
+    window.location.assign sehingga tidak menunggu event load penuh.
+
+    Jika navigasi cepat gagal (context script hancur di tengah navigasi,
+    atau dokumen baru tidak terdeteksi), kembali ke driver.get(url).
+
+    Args:
+        driver: Selenium WebDriver instance
+        url: URL tujuan
+
+    Returns:
+        bool: True jika halaman berhasil dibuka, False jika navigasi gagal
+    """
+    try:
+        if driver.current_url.startswith("https://x.com"):
+            # Penanda di window lama: hilang begitu dokumen baru dimuat, sehingga
+            # tunggu article berikutnya tidak menemukan tweet dari halaman lama.
+            # Selama navigasi execute_script bisa gagal (dokumen sedang
+            # di-unload); error itu diabaikan dan polling dilanjutkan.
+            driver.execute_script("window.__navPending = true; window.location.assign(arguments[0]);", url)
+            WebDriverWait(
+                driver, WEBDRIVER_WAIT_TIMEOUT, poll_frequency=0.1,
+                ignored_exceptions=(WebDriverException,)
+            ).until(lambda d: not d.execute_script("return window.__navPending === true"))
+            return True
+    except WebDriverException:
+        pass
+
+    try:
+        driver.get(url)
+    except WebDriverException:
+        return False
+    return True
+
+
+def _wait_document_ready(driver: webdriver.Chrome):
+    """Tunggu sampai DOM selesai di-parse (readyState bukan 'loading')."""
+    WebDriverWait(driver, WEBDRIVER_WAIT_TIMEOUT, poll_frequency=0.1).until(
+        lambda d: d.execute_script("return document.readyState") != "loading"
+    )
 
 
 def scrape_tweets(
@@ -64,7 +114,10 @@ def scrape_tweets(
         search_url += "&f=live"
 
     signals.log_signal.emit(f"{prefix}Mengunjungi halaman pencarian: {search_url}")
-    driver.get(search_url)
+
+    if not _navigate(driver, search_url):
+        signals.log_signal.emit(f"{prefix}Gagal membuka halaman pencarian.")
+        return []
 
     try:
         WebDriverWait(driver, WEBDRIVER_WAIT_TIMEOUT).until(
@@ -77,11 +130,11 @@ def scrape_tweets(
 
     tweets_data: Dict[str, Dict[str, Any]] = {}
     duplicate_count = 0
-    last_height = driver.execute_script("return document.body.scrollHeight")
     scroll_attempts = 0
 
     # Initialize deduplicator if not provided
-    if deduplicator is None:
+    owns_deduplicator = deduplicator is None
+    if owns_deduplicator:
         deduplicator = AdvancedDeduplicator()
 
     # Initialize progress tracker if not provided
@@ -96,10 +149,19 @@ def scrape_tweets(
     # Signal throttling configuration untuk mencegah GUI freeze
     # Emit signals hanya setiap N tweet untuk mengurangi signal flooding
     PROGRESS_UPDATE_INTERVAL = 5 if worker_id == 0 else 10  # Main thread lebih sering
-    DATA_ROW_BATCH_SIZE = 5  # Emit data row setiap 5 tweet
+    DATA_ROW_BATCH_SIZE = 50  # Emit maksimal 50 tweet per signal
     last_progress_count = 0
     data_row_buffer = []
 
+    # Use a local log function that includes prefix
+    def log_func(msg):
+        # signals.log_signal.emit(f"{prefix}{msg}")
+        pass # Reduce verbosity during parsing
+
+    # Harvester JS melakukan scroll dan ekstraksi di browser; jika gagal
+    # dipasang, kembali ke ekstraksi + scroll per iterasi dari Python
+    harvesting = start_harvest(driver, int(SCROLL_PAUSE_TIME * 1000), log_func)
+
     while len(tweets_data) < target_count:
         if stop_event.is_set():
             signals.log_signal.emit(f"{prefix}Proses dihentikan oleh pengguna.")
@@ -115,31 +177,32 @@ def scrape_tweets(
             (current_count - last_progress_count) >= PROGRESS_UPDATE_INTERVAL  # Interval reached
         )
 
-        if worker_id == 0 and should_emit_progress:
+        if worker_id == 0:
+            # Statistik dipublikasikan ke dict bersama; GUI membacanya dengan QTimer
             progress_tracker.update_progress(current_count, current_count)
             stats = progress_tracker.get_statistics()
-            signals.log_signal.emit(f"\nTweet: {current_count}/{target_count} | Kecepatan: {stats['current_speed']} | ETA: {stats['session_eta']} | Duplikat: {duplicate_count}")
-            signals.progress_signal.emit(current_count, target_count)
-            signals.stats_signal.emit(stats)
-            last_progress_count = current_count
+            signals.live_stats.update(stats, progress=(current_count, target_count))
+            if should_emit_progress:
+                signals.log_signal.emit(f"\nTweet: {current_count}/{target_count} | Kecepatan: {stats['current_speed']} | ETA: {stats['session_eta']} | Duplikat: {duplicate_count}")
+                last_progress_count = current_count
         elif worker_id > 0 and should_emit_progress:
             # Worker threads: log lebih jarang untuk mengurangi noise
             signals.log_signal.emit(f"{prefix}Progress: {current_count}/{target_count} tweets")
             last_progress_count = current_count
 
-        tweet_articles = driver.find_elements(By.XPATH, "//article[@data-testid='tweet']")
+        # Ambil tweet baru dalam satu execute_script
+        if harvesting:
+            parsed_tweets, page_grew = collect_harvest(driver, log_func)
+        else:
+            parsed_tweets = parse_tweet_articles(driver, log_func)
+
+        # Hash seluruh batch sekali, dipakai ulang oleh is_duplicate dan add_tweet
+        hashes_batch = deduplicator.generate_hashes_batch(parsed_tweets)
 
-        for article in tweet_articles:
+        for parsed_data, hashes in zip(parsed_tweets, hashes_batch):
             if stop_event.is_set():
                 break
 
-            # Use a local log function that includes prefix
-            def log_func(msg):
-                # signals.log_signal.emit(f"{prefix}{msg}")
-                pass # Reduce verbosity during parsing
-
-            parsed_data = parse_tweet_article(article, log_func)
-
             if parsed_data:
                 # Track if this tweet should be added to buffer (decided inside lock)
                 should_add_to_buffer = False
@@ -149,78 +212,79 @@ def scrape_tweets(
                 if lock:
                     with lock:
                         # Check for duplicates
-                        is_dup, reason = deduplicator.is_duplicate(parsed_data)
+                        is_dup, reason = deduplicator.is_duplicate(parsed_data, hashes)
 
                         # If not duplicate, add immediately within the same lock
                         if not is_dup and parsed_data["url"] not in tweets_data:
                             tweets_data[parsed_data["url"]] = parsed_data
-                            deduplicator.add_tweet(parsed_data)
+                            deduplicator.add_tweet(parsed_data, hashes)
                             should_add_to_buffer = True  # Mark for buffering
                         elif is_dup:
                             duplicate_count += 1
                         elif parsed_data["url"] in tweets_data:
                             duplicate_count += 1
-
-                    # Buffer data for batched emission (OUTSIDE lock)
-                    # Emit dalam batch untuk mengurangi signal flooding ke GUI
-                    if should_add_to_buffer:
-                        data_row_buffer.append(parsed_data)
-
-                        # Emit batch jika buffer sudah penuh
-                        if len(data_row_buffer) >= DATA_ROW_BATCH_SIZE:
-                            for buffered_data in data_row_buffer:
-                                signals.data_row_signal.emit(buffered_data)
-                            data_row_buffer.clear()
                 else:
                     # Single-threaded mode (no lock)
-                    is_dup, reason = deduplicator.is_duplicate(parsed_data)
+                    is_dup, reason = deduplicator.is_duplicate(parsed_data, hashes)
 
                     if not is_dup and parsed_data["url"] not in tweets_data:
                         tweets_data[parsed_data["url"]] = parsed_data
-                        deduplicator.add_tweet(parsed_data)
+                        deduplicator.add_tweet(parsed_data, hashes)
                         should_add_to_buffer = True
                     elif is_dup:
                         duplicate_count += 1
                     elif parsed_data["url"] in tweets_data:
                         duplicate_count += 1
 
-                    # Buffer untuk single-threaded mode juga
-                    if should_add_to_buffer:
-                        data_row_buffer.append(parsed_data)
+                # Buffer data for batched emission (OUTSIDE lock)
+                # Emit satu list per batch untuk mengurangi signal flooding ke GUI
+                if should_add_to_buffer:
+                    data_row_buffer.append(parsed_data)
+                    if len(data_row_buffer) >= DATA_ROW_BATCH_SIZE:
+                        signals.data_row_signal.emit(data_row_buffer)
+                        data_row_buffer = []
 
-                        # Emit batch jika buffer sudah penuh
-                        if len(data_row_buffer) >= DATA_ROW_BATCH_SIZE:
-                            for buffered_data in data_row_buffer:
-                                signals.data_row_signal.emit(buffered_data)
-                            data_row_buffer.clear()
+        # Kirim sisa batch di akhir setiap siklus harvest agar tabel GUI
+        # tetap ter-update setiap SCROLL_PAUSE_TIME detik
+        if data_row_buffer:
+            signals.data_row_signal.emit(data_row_buffer)
+            data_row_buffer = []
 
         if len(tweets_data) >= target_count:
             break
 
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(SCROLL_PAUSE_TIME)
+        # Perubahan tinggi halaman dideteksi di sisi JS (bersama poll
+        # harvester atau scroll), tanpa round-trip scrollHeight terpisah
+        if not harvesting:
+            page_grew = scroll_and_check(driver)
 
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
+        if not page_grew:
             scroll_attempts += 1
             if scroll_attempts > MAX_SCROLL_ATTEMPTS_WITHOUT_CHANGE:
                 signals.log_signal.emit("Berhenti scroll karena tinggi halaman tidak berubah.")
                 break
         else:
             scroll_attempts = 0
-        last_height = new_height
+
+        # wait() langsung kembali saat tombol Stop ditekan
+        if stop_event.wait(SCROLL_PAUSE_TIME):
+            signals.log_signal.emit(f"{prefix}Proses dihentikan oleh pengguna.")
+            break
+
+    if harvesting:
+        stop_harvest(driver)
 
     # Flush remaining buffered data rows sebelum selesai
-    # Emit sisa tweet yang masih ada di buffer
     if data_row_buffer:
-        for buffered_data in data_row_buffer:
-            signals.data_row_signal.emit(buffered_data)
-        data_row_buffer.clear()
+        signals.data_row_signal.emit(data_row_buffer)
 
+    if worker_id == 0:
+        signals.live_stats['progress'] = (len(tweets_data), target_count)
     signals.progress_signal.emit(len(tweets_data), target_count)
 
     # Finish session tracking
     progress_tracker.finish_session()
+    deduplicator.flush()
 
     # Log final statistics
     dedup_stats = deduplicator.get_stats()
@@ -229,7 +293,10 @@ def scrape_tweets(
     signals.log_signal.emit(f"Sesi selesai - Waktu: {progress_stats.get('avg_session_time', 'N/A')} | Kecepatan: {progress_stats['current_speed']} | Duplikat: {duplicate_count}")
     signals.log_signal.emit(f"Database: {dedup_stats['total_stored']} tweet unik tersimpan")
 
-    return list(tweets_data.values())[:target_count]
+    if owns_deduplicator:
+        deduplicator.close()
+
+    return list(islice(tweets_data.values(), target_count))
 
 
 def main_scraping_function(
@@ -283,77 +350,92 @@ def main_scraping_function(
     if cleaned > 0:
         signals.log_signal.emit(f"Membersihkan {cleaned} entri lama dari database.")
 
-    driver = setup_driver()
-    signals.log_signal.emit("Mengunjungi x.com dan menyuntikkan cookie...")
-    driver.get("https://x.com")
-    time.sleep(2)
-    driver.add_cookie({'name': 'auth_token', 'value': auth_token_cookie, 'domain': '.x.com'})
-
-    all_scraped_data = []
-    current_date = start_date
-
-    while current_date <= end_date:
-        if stop_event.is_set():
-            signals.log_signal.emit("Proses dihentikan sebelum sesi berikutnya.")
-            break
-
-        chunk_end_date = current_date + datetime.timedelta(days=interval)
-        since_str = current_date.strftime('%Y-%m-%d')
-        until_str = chunk_end_date.strftime('%Y-%m-%d')
-
-        # Update progress tracker for overall progress
-        progress_tracker.update_progress(0, len(all_scraped_data))
-        overall_stats = progress_tracker.get_statistics()
+    # Hasil tiap sesi langsung ditulis ke file, tidak ditampung di memory
+    safe_keyword = "".join(c for c in keyword if c.isalnum())
+    base_filename = f"tweets_{safe_keyword}_{search_type}_{start_date.strftime('%Y%m%d')}-{end_date.strftime('%Y%m%d')}"
+    exporter = TweetExporter(base_filename, export_format)
 
-        signals.log_signal.emit(f"\n--- Sesi {progress_tracker.session_number}/{total_sessions}: {since_str} hingga {until_str} ---")
-        signals.log_signal.emit(f"Progress keseluruhan: {overall_stats['total_progress']} | ETA total: {overall_stats['total_eta']}")
-
-        raw_query = f"{keyword} lang:{lang} until:{until_str} since:{since_str}"
-        query = quote(raw_query)
-        session_data = scrape_tweets(driver, query, target_per_session, search_type, signals, stop_event, deduplicator, progress_tracker)
-
-        if session_data:
-            all_scraped_data.extend(session_data)
-
-        signals.log_signal.emit(f"Sesi selesai. Total tweet terkumpul: {len(all_scraped_data)}")
-        current_date = chunk_end_date
-        if current_date <= end_date and not stop_event.is_set():
-            signals.log_signal.emit(f"Menunggu {SESSION_INTERVAL_WAIT} detik sebelum sesi berikutnya...")
-            time.sleep(SESSION_INTERVAL_WAIT)
-
-    if not all_scraped_data:
-        signals.log_signal.emit("Tidak ada data yang terkumpul untuk disimpan.")
-    else:
-        df = pd.DataFrame(all_scraped_data)
-
-        # Advanced deduplication already handled during scraping, but do final cleanup
-        initial_count = len(df)
-        df.drop_duplicates(subset=['url'], inplace=True)
-        final_count = len(df)
+    # driver dan koneksi database tetap ditutup (batch dedup tertunda
+    # ikut tersimpan) walaupun sesi gagal di tengah jalan
+    driver = None
+    try:
+        driver = setup_driver()
+        signals.log_signal.emit("Mengunjungi x.com dan menyuntikkan cookie...")
+        driver.get("https://x.com")
+        _wait_document_ready(driver)
+        driver.add_cookie({'name': 'auth_token', 'value': auth_token_cookie, 'domain': '.x.com'})
+
+        current_date = start_date
+        # Jaring pengaman URL duplikat antar sesi (menggantikan drop_duplicates akhir)
+        seen_urls = set()
+        extra_duplicates = 0
+
+        while current_date <= end_date:
+            if stop_event.is_set():
+                signals.log_signal.emit("Proses dihentikan sebelum sesi berikutnya.")
+                break
 
-        if initial_count != final_count:
-            signals.log_signal.emit(f"Pembersihan akhir: {initial_count - final_count} duplikat tambahan dihapus.")
+            chunk_end_date = current_date + datetime.timedelta(days=interval)
+            since_str = current_date.strftime('%Y-%m-%d')
+            until_str = chunk_end_date.strftime('%Y-%m-%d')
+
+            # Update progress tracker for overall progress
+            progress_tracker.update_progress(0, exporter.count)
+            overall_stats = progress_tracker.get_statistics()
+
+            signals.log_signal.emit(f"\n--- Sesi {progress_tracker.session_number}/{total_sessions}: {since_str} hingga {until_str} ---")
+            signals.log_signal.emit(f"Progress keseluruhan: {overall_stats['total_progress']} | ETA total: {overall_stats['total_eta']}")
+
+            raw_query = f"{keyword} lang:{lang} until:{until_str} since:{since_str}"
+            query = quote(raw_query)
+            session_data = scrape_tweets(driver, query, target_per_session, search_type, signals, stop_event, deduplicator, progress_tracker)
+
+            new_rows = [
+                row for row in session_data
+                if row['url'] not in seen_urls and not seen_urls.add(row['url'])
+            ]
+            extra_duplicates += len(session_data) - len(new_rows)
+
+            if new_rows:
+                try:
+                    exporter.write_rows(new_rows)
+                except Exception as e:
+                    signals.log_signal.emit(f"\n!!! Gagal menyimpan file: {e} !!!")
+                    break
+
+            signals.log_signal.emit(f"Sesi selesai. Total tweet terkumpul: {exporter.count}")
+            current_date = chunk_end_date
+            if current_date <= end_date and not stop_event.is_set():
+                signals.log_signal.emit(f"Menunggu {SESSION_INTERVAL_WAIT} detik sebelum sesi berikutnya...")
+                if stop_event.wait(SESSION_INTERVAL_WAIT):
+                    signals.log_signal.emit("Proses dihentikan sebelum sesi berikutnya.")
+                    break
 
-        # Get final deduplication stats
-        final_stats = deduplicator.get_stats()
-        signals.log_signal.emit(f"Total tweet unik dalam database: {final_stats['total_stored']}")
+        try:
+            filename = exporter.close()
+        except Exception as e:
+            filename = None
+            signals.log_signal.emit(f"\n!!! Gagal menyimpan file: {e} !!!")
 
-        safe_keyword = "".join(c for c in keyword if c.isalnum())
-        base_filename = f"tweets_{safe_keyword}_{search_type}_{start_date.strftime('%Y%m%d')}-{end_date.strftime('%Y%m%d')}"
+        if extra_duplicates:
+            signals.log_signal.emit(f"Pembersihan akhir: {extra_duplicates} duplikat tambahan dihapus.")
 
+        if not exporter.count:
+            signals.log_signal.emit("Tidak ada data yang terkumpul untuk disimpan.")
+        else:
+            # Get final deduplication stats
+            final_stats = deduplicator.get_stats()
+            signals.log_signal.emit(f"Total tweet unik dalam database: {final_stats['total_stored']}")
+
+            if filename:
+                signals.log_signal.emit(f"\nData disimpan ke: {filename} ({len(seen_urls)} tweet unik)")
+    finally:
+        # Pastikan file output tetap valid (penutup JSON, save workbook,
+        # footer Parquet) walaupun sesi gagal; no-op jika sudah ditutup
         try:
-            if export_format == 'CSV':
-                filename = f"{base_filename}.csv"
-                df.to_csv(filename, index=False, encoding='utf-8-sig')
-            elif export_format == 'JSON':
-                filename = f"{base_filename}.json"
-                df.to_json(filename, orient='records', indent=4)
-            elif export_format == 'Excel':
-                filename = f"{base_filename}.xlsx"
-                df.to_excel(filename, index=False)
-
-            signals.log_signal.emit(f"\nData disimpan ke: {filename} ({len(df)} tweet unik)")
+            exporter.close()
         except Exception as e:
             signals.log_signal.emit(f"\n!!! Gagal menyimpan file: {e} !!!")
-
-    driver.quit()
+        if driver is not None:
+            driver.quit()
+        deduplicator.close()